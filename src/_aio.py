@@ -0,0 +1,25 @@
+"""
+src/_aio.py
+───────────
+Run a coroutine to completion from synchronous code, whether or not the
+caller already has an event loop running (Jupyter, FastAPI handlers, ...).
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    asyncio.run(coro) when no loop is running in this thread; otherwise run
+    it on a fresh loop in a helper thread and block until it finishes.
+    Async callers should await the coroutine directly instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="run_sync") as pool:
+        return pool.submit(asyncio.run, coro).result()
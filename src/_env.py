@@ -0,0 +1,34 @@
+"""
+src/_env.py
+───────────
+Single shared loader for .env so the file is read and parsed exactly once
+per process, no matter how many config modules ask for it.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+_LOADED = False
+
+
+def load_once() -> None:
+    """Load .env on first call. override=True so it always wins over system env."""
+    global _LOADED
+    if _LOADED:
+        return
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
+    _LOADED = True
+
+
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Integer knob from the environment, at least minimum; a malformed value warns and uses default."""
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; using %d", name, raw, default)
+        return default
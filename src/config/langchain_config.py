@@ -4,24 +4,106 @@ src/config/langchain_config.py
 LangChain configuration with Groq, Ollama, and cloud provider support.
 Uses lazy imports to avoid ImportError when optional dependencies are missing.
 """
+import functools
 import os
 import logging
-from typing import Optional, TYPE_CHECKING
-from langchain_core.language_models import BaseChatModel
-from dotenv import load_dotenv
-# Load .env at module import time (works for tests + main app)
-load_dotenv(override=True)   # override=True so it always wins over system env
+import socket
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import urlparse
+from src._env import load_once
 
 logger = logging.getLogger(__name__)
 
 # Type checking only - avoids runtime import errors
 if TYPE_CHECKING:
+    import httpx
+    from langchain_core.language_models import BaseChatModel
     from langchain_groq import ChatGroq
     from langchain_ollama import ChatOllama
     from langchain_openai import ChatOpenAI
     from langchain_anthropic import ChatAnthropic
 
-logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True, slots=True)
+class _EnvCache:
+    """Snapshot of every LLM-related environment variable, read once."""
+    llm_provider: str
+    groq_api_key: Optional[str]
+    groq_model: str
+    groq_code_model: str
+    groq_doc_model: str
+    groq_judge_model: str
+    groq_fallback_model: str
+    ollama_model: str
+    ollama_base_url: str
+    openai_api_key: Optional[str]
+    openai_model: str
+    openai_base_url: Optional[str]
+    anthropic_api_key: Optional[str]
+    anthropic_model: str
+    vllm_model: str
+    vllm_url: str
+    vllm_api_key: str
+
+    @classmethod
+    def from_environ(cls) -> "_EnvCache":
+        return cls(
+            llm_provider=os.getenv("LLM_PROVIDER", "groq"),
+            groq_api_key=os.getenv("GROQ_API_KEY"),
+            groq_model=os.getenv("GROQ_MODEL", "llama3-8b-8192"),
+            groq_code_model=os.getenv("GROQ_CODE_MODEL", "llama3-8b-8192"),
+            groq_doc_model=os.getenv("GROQ_DOC_MODEL", "mixtral-8x7b-32768"),
+            groq_judge_model=os.getenv("GROQ_JUDGE_MODEL", "llama3-70b-8192"),
+            groq_fallback_model=os.getenv("GROQ_FALLBACK_MODEL", "llama3-8b-8192"),
+            ollama_model=os.getenv("OLLAMA_MODEL", "llama3.1:8b"),
+            ollama_base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            openai_base_url=os.getenv("OPENAI_BASE_URL"),
+            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
+            anthropic_model=os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307"),
+            vllm_model=os.getenv("VLLM_MODEL", "meta-llama/Llama-3.1-8B-Instruct"),
+            vllm_url=os.getenv("VLLM_URL", "http://localhost:8000/v1"),
+            vllm_api_key=os.getenv("VLLM_API_KEY", "EMPTY"),
+        )
+
+
+_ENV: Optional[_EnvCache] = None
+
+# Chat models are memoised per (provider, model, temperature, kwargs) so each
+# layer reuses one HTTP client instead of constructing a new one per call.
+_LLM_CACHE: Dict[Tuple[Any, ...], "BaseChatModel"] = {}
+
+# Shared keep-alive client for the Ollama probe, created on first use.
+_HTTPX: Optional["httpx.Client"] = None
+
+
+def _env() -> _EnvCache:
+    """Return the environment snapshot, loading .env and reading it on first use."""
+    global _ENV
+    if _ENV is None:
+        load_once()
+        _ENV = _EnvCache.from_environ()
+    return _ENV
+
+
+def _reload_env() -> _EnvCache:
+    """Discard the snapshot and cached clients and re-read the environment (for tests)."""
+    global _ENV
+    _ENV = None
+    _LLM_CACHE.clear()
+    detect_available_provider.cache_clear()
+    return _env()
+
+
+def __getattr__(name: str):
+    """Resolve BaseChatModel lazily so importing this module stays cheap."""
+    if name == "BaseChatModel":
+        from langchain_core.language_models import BaseChatModel as _BaseChatModel
+        globals()["BaseChatModel"] = _BaseChatModel
+        return _BaseChatModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_llm(
@@ -29,14 +111,14 @@ def get_llm(
     model_name: Optional[str] = None,
     temperature: float = 0.3,
     **kwargs
-) -> BaseChatModel:
+) -> "BaseChatModel":
     """
     Factory function to get LLM based on provider.
     
-    Priority: Groq → Ollama → OpenAI → Anthropic
+    Priority: Groq → Ollama → vLLM → OpenAI → Anthropic
     
     Args:
-        provider: "groq", "ollama", "openai", or "anthropic"
+        provider: "groq", "ollama", "vllm", "openai", or "anthropic"
         model_name: Specific model name (uses config default if None)
         temperature: Model temperature for sampling
         **kwargs: Additional model arguments
@@ -45,22 +127,39 @@ def get_llm(
         Configured LangChain ChatModel instance
     """
     if provider == "groq":
-        return _get_groq(model_name, temperature, **kwargs)
+        factory = _get_groq
     elif provider == "ollama":
-        return _get_ollama(model_name, temperature, **kwargs)
+        factory = _get_ollama
     elif provider == "openai":
-        return _get_openai(model_name, temperature, **kwargs)
+        factory = _get_openai
     elif provider == "anthropic":
-        return _get_anthropic(model_name, temperature, **kwargs)
+        factory = _get_anthropic
+    elif provider == "vllm":
+        factory = _get_vllm
     else:
         raise ValueError(f"Unknown provider: {provider}")
 
+    try:
+        key: Optional[Tuple[Any, ...]] = (
+            provider, model_name, temperature, frozenset(kwargs.items())
+        )
+        hash(key)
+    except TypeError:
+        key = None  # unhashable kwargs — build a fresh, uncached client
+    if key is not None and key in _LLM_CACHE:
+        return _LLM_CACHE[key]
+
+    llm = factory(model_name, temperature, **kwargs)
+    if key is not None:
+        _LLM_CACHE[key] = llm
+    return llm
+
 
 def _get_groq(
     model_name: Optional[str],
     temperature: float,
     **kwargs
-) -> BaseChatModel:
+) -> "BaseChatModel":
     """Get Groq chat model with lazy import. FIXED: No base_url duplication."""
     try:
         from langchain_groq import ChatGroq
@@ -71,14 +170,15 @@ def _get_groq(
             "Install with: pip install langchain-groq"
         ) from exc
     
-    api_key = os.getenv("GROQ_API_KEY")
+    env = _env()
+    api_key = env.groq_api_key
     if not api_key:
         raise EnvironmentError(
             "GROQ_API_KEY not set in environment. "
             "Get key from https://console.groq.com and add to .env"
         )
     
-    model = model_name or os.getenv("GROQ_MODEL", "llama3-8b-8192")
+    model = model_name or env.groq_model
     
     logger.info("🚀 Initializing Groq: %s", model)
     
@@ -99,7 +199,7 @@ def _get_ollama(
     model_name: Optional[str],
     temperature: float,
     **kwargs
-) -> BaseChatModel:
+) -> "BaseChatModel":
     """Get Ollama chat model with lazy import."""
     try:
         from langchain_ollama import ChatOllama
@@ -110,8 +210,9 @@ def _get_ollama(
             "Install with: pip install langchain-ollama"
         ) from exc
     
-    model = model_name or os.getenv("OLLAMA_MODEL", "llama3.1:8b")
-    base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    env = _env()
+    model = model_name or env.ollama_model
+    base_url = env.ollama_base_url
     
     logger.info("🦙 Initializing Ollama: %s @ %s", model, base_url)
     
@@ -129,7 +230,7 @@ def _get_openai(
     model_name: Optional[str],
     temperature: float,
     **kwargs
-) -> BaseChatModel:
+) -> "BaseChatModel":
     """Get OpenAI chat model with lazy import."""
     try:
         from langchain_openai import ChatOpenAI
@@ -140,11 +241,12 @@ def _get_openai(
             "Install with: pip install langchain-openai"
         ) from exc
     
-    api_key = os.getenv("OPENAI_API_KEY")
+    env = _env()
+    api_key = env.openai_api_key
     if not api_key:
         raise EnvironmentError("OPENAI_API_KEY not set in environment")
     
-    model = model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    model = model_name or env.openai_model
     
     logger.info("🔵 Initializing OpenAI: %s", model)
     
@@ -152,7 +254,7 @@ def _get_openai(
         model=model,
         temperature=temperature,
         api_key=api_key,
-        base_url=os.getenv("OPENAI_BASE_URL"),
+        base_url=env.openai_base_url,
         timeout=kwargs.get("timeout", 60),
         max_retries=kwargs.get("max_retries", 2),
     )
@@ -162,7 +264,7 @@ def _get_anthropic(
     model_name: Optional[str],
     temperature: float,
     **kwargs
-) -> BaseChatModel:
+) -> "BaseChatModel":
     """Get Anthropic chat model with lazy import."""
     try:
         from langchain_anthropic import ChatAnthropic
@@ -173,11 +275,12 @@ def _get_anthropic(
             "Install with: pip install langchain-anthropic"
         ) from exc
     
-    api_key = os.getenv("ANTHROPIC_API_KEY")
+    env = _env()
+    api_key = env.anthropic_api_key
     if not api_key:
         raise EnvironmentError("ANTHROPIC_API_KEY not set in environment")
     
-    model = model_name or os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
+    model = model_name or env.anthropic_model
     
     logger.info("🟠 Initializing Anthropic: %s", model)
     
@@ -190,54 +293,92 @@ def _get_anthropic(
     )
 
 
+def _get_vllm(
+    model_name: Optional[str],
+    temperature: float,
+    **kwargs
+) -> "BaseChatModel":
+    """
+    Get a chat model for a self-hosted vLLM server (OpenAI-compatible API).
+    Continuous batching + prefix caching serve the concurrent judge calls
+    on one GPU. Launch with
+        python -m vllm.entrypoints.openai.api_server --model <model> \\
+            --max-num-batched-tokens 8192 --enable-prefix-caching
+    """
+    try:
+        from langchain_openai import ChatOpenAI
+    except ImportError as exc:
+        logger.error("langchain-openai not installed. Run: pip install langchain-openai")
+        raise ImportError(
+            "vLLM support requires 'langchain-openai'. "
+            "Install with: pip install langchain-openai"
+        ) from exc
+
+    env = _env()
+    model = model_name or env.vllm_model
+
+    logger.info("⚡ Initializing vLLM: %s @ %s", model, env.vllm_url)
+
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        api_key=env.vllm_api_key,
+        base_url=env.vllm_url,
+        timeout=kwargs.get("timeout", 300),
+        max_retries=kwargs.get("max_retries", 2),
+    )
+
+
 # ─────────────────────────────────────────────────────────────
 # Convenience functions for specific layers (Groq-optimized)
 # ─────────────────────────────────────────────────────────────
 
-def get_detective_llm(task: str = "code") -> BaseChatModel:
+def get_detective_llm(task: str = "code") -> "BaseChatModel":
     """
     Get LLM for detective layer tasks.
     
     Groq models are fast and cost-effective for forensic analysis.
     """
-    provider = os.getenv("LLM_PROVIDER", "groq")
+    env = _env()
+    provider = env.llm_provider
     
     if task == "code":
         # Code analysis: Llama 3 8B is fast and capable
         return get_llm(
             provider=provider,
-            model_name=os.getenv("GROQ_CODE_MODEL", "llama3-8b-8192"),
+            model_name=env.groq_code_model,
             temperature=0.2,
         )
     else:
         # Text/PDF analysis: Mixtral for better reasoning
         return get_llm(
             provider=provider,
-            model_name=os.getenv("GROQ_DOC_MODEL", "mixtral-8x7b-32768"),
+            model_name=env.groq_doc_model,
             temperature=0.3,
         )
 
 
-def get_judge_llm(persona: str = "primary") -> BaseChatModel:
+def get_judge_llm(persona: str = "primary") -> "BaseChatModel":
     """
     Get LLM for judicial layer tasks.
     
     Groq Llama 3 70B provides excellent reasoning for judicial personas.
     """
-    provider = os.getenv("LLM_PROVIDER", "groq")
+    env = _env()
+    provider = env.llm_provider
     
     if persona == "fallback":
         # Fallback: smaller, faster model
         return get_llm(
             provider=provider,
-            model_name=os.getenv("GROQ_FALLBACK_MODEL", "llama3-8b-8192"),
+            model_name=env.groq_fallback_model,
             temperature=0.4,
         )
     else:
         # Primary: Llama 3 70B for best reasoning
         return get_llm(
             provider=provider,
-            model_name=os.getenv("GROQ_JUDGE_MODEL", "llama3-70b-8192"),
+            model_name=env.groq_judge_model,
             temperature=0.4,
         )
 
@@ -246,34 +387,64 @@ def get_judge_llm(persona: str = "primary") -> BaseChatModel:
 # Provider detection helper
 # ─────────────────────────────────────────────────────────────
 
+def _port_open(base_url: str) -> bool:
+    """Cheap TCP probe that fails fast on a closed port."""
+    parsed = urlparse(base_url)
+    host = parsed.hostname or "localhost"
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        with socket.create_connection((host, port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def _ollama_reachable(base_url: str) -> bool:
+    """
+    TCP probe first, then one GET to /api/tags over a shared keep-alive
+    httpx client.
+    """
+    global _HTTPX
+    if not _port_open(base_url):
+        return False
+
+    try:
+        if _HTTPX is None:
+            import httpx
+            _HTTPX = httpx.Client(timeout=2.0)
+        response = _HTTPX.get(base_url + "/api/tags")
+        return response.status_code == 200
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
 def detect_available_provider() -> str:
     """
     Detect which LLM provider is configured and available.
+    The result is cached for the life of the process (cleared by _reload_env).
     
-    Returns: "groq", "ollama", "openai", "anthropic", or "none"
+    Returns: "groq", "ollama", "vllm", "openai", "anthropic", or "none"
     """
+    env = _env()
     # Check Groq first (fastest, recommended)
-    if os.getenv("GROQ_API_KEY"):
+    if env.groq_api_key:
         return "groq"
     
     # Check Ollama (local)
-    try:
-        import httpx
-        response = httpx.get(
-            os.getenv("OLLAMA_BASE_URL", "http://localhost:11434") + "/api/tags",
-            timeout=5
-        )
-        if response.status_code == 200:
-            return "ollama"
-    except Exception:
-        pass
+    if _ollama_reachable(env.ollama_base_url):
+        return "ollama"
+
+    # Check vLLM (self-hosted) only when it was asked for
+    if env.llm_provider == "vllm" and _port_open(env.vllm_url):
+        return "vllm"
     
     # Check OpenAI
-    if os.getenv("OPENAI_API_KEY"):
+    if env.openai_api_key:
         return "openai"
     
     # Check Anthropic
-    if os.getenv("ANTHROPIC_API_KEY"):
+    if env.anthropic_api_key:
         return "anthropic"
     
-    return "none"
\ No newline at end of file
+    return "none"
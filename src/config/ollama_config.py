@@ -5,11 +5,11 @@ Ollama model configuration for Automaton Auditor.
 Centralized model selection with fallback logic.
 """
 import os
-from typing import Dict, Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 
 
-class OllamaModel(BaseModel):
+@dataclass(slots=True)
+class OllamaModel:
     """Model configuration for Ollama."""
     name: str
     base_url: str = "http://localhost:11434"
@@ -19,11 +19,12 @@ class OllamaModel(BaseModel):
     timeout: int = 120  # Seconds
 
 
-class OllamaConfig(BaseModel):
+@dataclass(slots=True)
+class OllamaConfig:
     """Complete Ollama configuration for all agent layers."""
     
     # Detective Layer
-    code_analyst: OllamaModel = Field(
+    code_analyst: OllamaModel = field(
         default_factory=lambda: OllamaModel(
             name="qwen2.5-coder:7b",
             temperature=0.2,  # Lower for factual analysis
@@ -31,7 +32,7 @@ class OllamaConfig(BaseModel):
         )
     )
     
-    doc_analyst: OllamaModel = Field(
+    doc_analyst: OllamaModel = field(
         default_factory=lambda: OllamaModel(
             name="llama3.2:3b",
             temperature=0.3,
@@ -40,7 +41,7 @@ class OllamaConfig(BaseModel):
     )
     
     # Judicial Layer
-    judge_primary: OllamaModel = Field(
+    judge_primary: OllamaModel = field(
         default_factory=lambda: OllamaModel(
             name="mistral-nemo:12b",
             temperature=0.4,  # Higher for creative arguments
@@ -48,7 +49,7 @@ class OllamaConfig(BaseModel):
         )
     )
     
-    judge_fallback: OllamaModel = Field(
+    judge_fallback: OllamaModel = field(
         default_factory=lambda: OllamaModel(
             name="llama3.1:8b",
             temperature=0.4,
@@ -42,32 +42,96 @@ RepoInvestigator  DocAnalyst     VisionInspector
 CLI usage:
     python -m src.graph <github_url> [pdf_path] [self|peer|received]
 """
+import asyncio
+import atexit
+import functools
 import json
 import logging
-from datetime import datetime
+import mmap
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
-
-from langgraph.graph import END, START, StateGraph
+from typing import TYPE_CHECKING, Any, Dict
 
+from src._aio import run_sync
+from src._env import load_once
 from src.state import AgentState, AuditReport, CriterionResult
-from src.nodes.detectives import (
-    doc_analyst_node,
-    evidence_aggregator_node,
-    repo_investigator_node,
-    vision_inspector_node,
-)
-from src.nodes.judges import defense_node, prosecutor_node, tech_lead_node
-from src.nodes.justice import chief_justice_node, generate_markdown_report
+
+# LangGraph and the node modules (which pull in the LLM clients) are imported
+# inside build_graph() / report_saver_node() so `import src.graph` stays cheap.
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
 
 logger = logging.getLogger(__name__)
-RUBRIC_PATH = Path(__file__).parent.parent / "rubric" / "week2_rubric.json"
+_LOG_FMT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+_RULE = "=" * 60
+_RUBRIC_MMAP_THRESHOLD = 1 << 20  # 1 MiB
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RUBRIC_PATH = _PROJECT_ROOT / "rubric" / "week2_rubric.json"
+AUDIT_BASE = _PROJECT_ROOT / "audit"
+AUDIT_DIRS: Dict[str, Path] = {
+    "self":     AUDIT_BASE / "report_onself_generated",
+    "peer":     AUDIT_BASE / "report_onpeer_generated",
+    "received": AUDIT_BASE / "report_bypeer_received",
+}
+LANGSMITH_LOG_DIR = AUDIT_BASE / "langsmith_logs"
+# Anything outside [A-Za-z0-9_.-] in the repo name becomes "_" in filenames
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+# Report writes run on a small pool so the event loop is never blocked on disk
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report_io")
+atexit.register(_IO_POOL.shutdown, wait=True)
+_DIRS_CREATED: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p once per process; later calls skip the syscall."""
+    if path not in _DIRS_CREATED:
+        path.mkdir(parents=True, exist_ok=True)
+        _DIRS_CREATED.add(path)
 
 
 # ─────────────────────────────────────────────────────────────
 # UTILITY NODES
 # ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4)
+def _load_rubric(path: str, mtime_ns: int) -> tuple[list, dict, frozenset]:
+    """
+    Parse the rubric once per (path, mtime) pair.
+    mtime_ns is part of the cache key so an edited rubric is re-read.
+    Returns (dimensions, synthesis_rules, expected dimension-ID set).
+    """
+    try:
+        import orjson  # optional: C parser, same dict shape as stdlib json
+    except ImportError:
+        orjson = None
+
+    # Parse from one in-memory buffer rather than streaming through a
+    # TextIOWrapper. Large rubrics are mmap'd when orjson can read the
+    # mapping directly (stdlib json needs a bytes copy anyway).
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is not None and size >= _RUBRIC_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    rubric = orjson.loads(view)
+        else:
+            data = f.read()
+            rubric = orjson.loads(data) if orjson is not None else json.loads(data)
+    dimensions = rubric.get("dimensions", [])
+    # Dimension IDs are used as evidence/opinion dict keys everywhere
+    # downstream; interning them lets those lookups hit on identity.
+    for dim in dimensions:
+        if isinstance(dim.get("id"), str):
+            dim["id"] = sys.intern(dim["id"])
+    expected_ids = frozenset(d["id"] for d in dimensions if d.get("id"))
+    return dimensions, rubric.get("synthesis_rules", {}), expected_ids
+
+
 def context_builder_node(state: AgentState) -> dict:
     """
     Entry node: loads week2_rubric.json and injects dimensions +
@@ -79,23 +143,33 @@ def context_builder_node(state: AgentState) -> dict:
         logger.error("Rubric not found: %s", RUBRIC_PATH)
         return {"errors": [f"Rubric file not found: {RUBRIC_PATH}"]}
 
-    with open(RUBRIC_PATH) as f:
-        rubric = json.load(f)
-
-    dimensions = rubric.get("dimensions", [])
-    synthesis_rules = rubric.get("synthesis_rules", {})
+    dimensions, synthesis_rules, expected_dim_ids = _load_rubric(
+        str(RUBRIC_PATH), RUBRIC_PATH.stat().st_mtime_ns
+    )
     logger.info("  Loaded %d dimensions, %d synthesis rules", len(dimensions), len(synthesis_rules))
 
     return {
         "rubric_dimensions": dimensions,
         "synthesis_rules": synthesis_rules,
+        "expected_dim_ids": expected_dim_ids,
         "evidences": {},
         "opinions": [],
         "errors": [],
+        "failed_nodes": [],
+        "completed_detectives": [],
         "final_report": None,
     }
 
 
+# Shared by every CriterionResult that ErrorReporter fabricates.
+_FATAL_DISSENT = "No evidence collected — all detective nodes failed."
+_FATAL_REMEDIATION = (
+    "1. Verify the repo URL is public and reachable.\n"
+    "2. Check GROQ_API_KEY is valid and quota is not exhausted.\n"
+    "3. Re-run: python -m src.graph <url> <pdf> <type>"
+)
+
+
 def error_reporter_node(state: AgentState) -> dict:
     """
     Fallback node reached when EvidenceAggregator finds zero evidence
@@ -110,18 +184,15 @@ def error_reporter_node(state: AgentState) -> dict:
     logger.error("💀 ErrorReporter: no evidence collected — building diagnostic report")
     logger.error("   Errors: %s", errors)
 
+    # Fabricated, known-valid values → model_construct skips re-validation
     criteria = [
-        CriterionResult(
+        CriterionResult.model_construct(
             dimension_id=d.get("id", "unknown"),
             dimension_name=d.get("name", "Unknown"),
             final_score=1,
             judge_opinions=[],
-            dissent_summary="No evidence collected — all detective nodes failed.",
-            remediation=(
-                "1. Verify the repo URL is public and reachable.\n"
-                "2. Check GROQ_API_KEY is valid and quota is not exhausted.\n"
-                "3. Re-run: python -m src.graph <url> <pdf> <type>"
-            ),
+            dissent_summary=_FATAL_DISSENT,
+            remediation=_FATAL_REMEDIATION,
         )
         for d in dimensions
     ]
@@ -142,7 +213,7 @@ def error_reporter_node(state: AgentState) -> dict:
     return {"final_report": report}
 
 
-def report_saver_node(state: AgentState) -> dict:
+async def report_saver_node(state: AgentState) -> dict:
     """
     Serialise AuditReport → Markdown and write to the appropriate
     audit/ subfolder based on audit_type: self | peer | received.
@@ -155,23 +226,27 @@ def report_saver_node(state: AgentState) -> dict:
         logger.warning("ReportSaver: no AuditReport in state — nothing to save")
         return {}
 
-    md = generate_markdown_report(report)
-
-    base = Path(__file__).parent.parent / "audit"
-    dirs = {
-        "self":     base / "report_onself_generated",
-        "peer":     base / "report_onpeer_generated",
-        "received": base / "report_bypeer_received",
-    }
-    out_dir = dirs.get(audit_type, base / "report_onpeer_generated")
-    out_dir.mkdir(parents=True, exist_ok=True)
-    (base / "langsmith_logs").mkdir(parents=True, exist_ok=True)
+    from src.nodes.justice import generate_markdown_report
 
-    slug = (repo_url.rstrip("/").split("/")[-1] or "repo")[:40]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    out_path = out_dir / f"audit_{slug}_{timestamp}.md"
+    md = generate_markdown_report(report)
 
-    out_path.write_text(md, encoding="utf-8")
+    out_dir = AUDIT_DIRS.get(audit_type, AUDIT_DIRS["peer"])
+    slug = _SLUG_RE.sub("_", repo_url.rstrip("/").rpartition("/")[2] or "repo")[:40]
+    # Seconds-resolution stamp stays human-sortable; the microsecond suffix
+    # keeps filenames unique when several audits finish in the same second.
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(secs))
+    out_path = out_dir / f"audit_{slug}_{timestamp}_{ns // 1000:06d}.md"
+
+    # Awaited, so the file exists by the time the audit returns
+    loop = asyncio.get_running_loop()
+    try:
+        _ensure_dir(out_dir)
+        _ensure_dir(LANGSMITH_LOG_DIR)
+        await loop.run_in_executor(_IO_POOL, out_path.write_bytes, md.encode("utf-8"))
+    except OSError as exc:
+        logger.error("  ❌ Report write failed → %s: %s", out_path, exc)
+        return {"errors": [f"ReportSaver: could not write {out_path}: {exc}"]}
     logger.info("  ✅ Report saved → %s", out_path)
     return {}
 
@@ -181,9 +256,8 @@ def report_saver_node(state: AgentState) -> dict:
 # ─────────────────────────────────────────────────────────────
 
 # Evidence keys each detective is responsible for producing.
-# Used to detect whether a crashed detective produced anything at all.
-_DETECTIVE_KEYS: Dict[str, set] = {
-    "RepoInvestigator": {
+_DETECTIVE_KEYS: Dict[str, frozenset] = {
+    "RepoInvestigator": frozenset({
         "git_forensic_analysis",
         "state_management_rigor",
         "graph_orchestration",
@@ -191,9 +265,14 @@ _DETECTIVE_KEYS: Dict[str, set] = {
         "structured_output_enforcement",
         "judicial_nuance",
         "chief_justice_synthesis",
-    },
-    "DocAnalyst":      {"theoretical_depth", "report_accuracy"},
-    "VisionInspector": {"swarm_visual"},
+    }),
+    "DocAnalyst":      frozenset({"theoretical_depth", "report_accuracy"}),
+    "VisionInspector": frozenset({"swarm_visual"}),
+}
+
+# Reverse index: evidence key → detective that produces it (provenance lookup).
+_KEY_TO_DETECTIVE: Dict[str, str] = {
+    key: name for name, keys in _DETECTIVE_KEYS.items() for key in keys
 }
 
 
@@ -202,8 +281,9 @@ def _route_detective(node_name: str):
     Returns a routing function for the given detective node.
 
     Logic:
-    - If the node logged an error AND produced zero expected evidence keys
-      → route "error" (still goes to EvidenceAggregator for fan-in convergence)
+    - If the node is listed in state.failed_nodes AND never recorded itself
+      in state.completed_detectives (i.e. wrote no evidence) → route "error"
+      (still goes to EvidenceAggregator for fan-in convergence)
     - Otherwise → route "ok"
 
     Both "ok" and "error" map to EvidenceAggregator because ALL three
@@ -211,14 +291,10 @@ def _route_detective(node_name: str):
     the judicial fan-out can be released by LangGraph.  The distinction
     matters for logging and future extension (e.g. retry logic).
     """
-    expected = _DETECTIVE_KEYS.get(node_name, set())
-
-    def _route(state: AgentState) -> str:
-        errors = state.get("errors", [])
-        produced = expected & set(state.get("evidences", {}).keys())
-        node_errored = any(node_name in e for e in errors)
-
-        if node_errored and not produced:
+    def _route(state: AgentState, node_name: str = node_name) -> str:
+        if node_name in state.get("completed_detectives", ()):
+            return "ok"
+        if node_name in state.get("failed_nodes", ()):
             logger.warning(
                 "⚠  %s: crashed with no evidence produced — logging error, "
                 "continuing to EvidenceAggregator",
@@ -230,6 +306,10 @@ def _route_detective(node_name: str):
     return _route
 
 
+# One router per detective, built once at import time.
+_ROUTERS = {name: _route_detective(name) for name in _DETECTIVE_KEYS}
+
+
 def _route_after_aggregation(state: AgentState) -> str:
     """
     Gate between the detective layer and the judicial layer.
@@ -238,14 +318,15 @@ def _route_after_aggregation(state: AgentState) -> str:
         "ok"    → at least one evidence key collected → invoke judges
         "fatal" → zero evidence collected → route to ErrorReporter
     """
-    evidences = state.get("evidences", {})
-    errors = state.get("errors", [])
+    evidences = state.get("evidences")
+    errors = state.get("errors") or ()
 
     if evidences:
-        if errors:
+        if errors and logger.isEnabledFor(logging.WARNING):
+            sources = sorted({_KEY_TO_DETECTIVE.get(k, "unknown") for k in evidences})
             logger.warning(
-                "  Proceeding with %d evidence key(s) despite %d error(s): %s",
-                len(evidences), len(errors), errors[:3],
+                "  Proceeding with %d evidence key(s) from %s despite %d error(s): %.200s",
+                len(evidences), sources, len(errors), errors,
             )
         return "ok"
 
@@ -257,7 +338,7 @@ def _route_after_aggregation(state: AgentState) -> str:
 # GRAPH CONSTRUCTION
 # ─────────────────────────────────────────────────────────────
 
-def build_graph() -> StateGraph:
+def build_graph() -> "StateGraph":
     """
     Assemble the hierarchical StateGraph with conditional error routing.
 
@@ -276,6 +357,17 @@ def build_graph() -> StateGraph:
         Unconditional parallel fan-out/fan-in — once evidence exists the
         three judges always run and converge on ChiefJustice.
     """
+    from langgraph.graph import END, START, StateGraph
+
+    from src.nodes.detectives import (
+        doc_analyst_node,
+        evidence_aggregator_node,
+        repo_investigator_node,
+        vision_inspector_node,
+    )
+    from src.nodes.judges import defense_node, prosecutor_node, tech_lead_node
+    from src.nodes.justice import chief_justice_node
+
     g = StateGraph(AgentState)
 
     # ── Register all nodes ──────────────────────────────────
@@ -306,7 +398,7 @@ def build_graph() -> StateGraph:
     for node in ("RepoInvestigator", "DocAnalyst", "VisionInspector"):
         g.add_conditional_edges(
             node,
-            _route_detective(node),
+            _ROUTERS[node],
             {
                 "ok":    "EvidenceAggregator",
                 "error": "EvidenceAggregator",   # still converges for fan-in
@@ -343,8 +435,14 @@ def build_graph() -> StateGraph:
     return g
 
 
+@functools.lru_cache(maxsize=1)
 def compile_graph():
-    """Compile and return the executable LangGraph runnable."""
+    """
+    Compile and return the executable LangGraph runnable.
+
+    The compiled graph is memoised so repeated run_audit() calls reuse it.
+    Call compile_graph.cache_clear() after changing the graph topology.
+    """
     compiled = build_graph().compile()
     logger.info("✅ StateGraph compiled successfully")
     return compiled
@@ -358,6 +456,19 @@ def run_audit(
     repo_url: str,
     pdf_path: str = "",
     audit_type: str = "peer",
+) -> Dict[str, Any]:
+    """
+    Synchronous entry point for arun_audit. Safe to call from code that
+    already runs an event loop (notebooks, web handlers); async callers
+    should await arun_audit directly.
+    """
+    return run_sync(arun_audit(repo_url, pdf_path, audit_type))
+
+
+async def arun_audit(
+    repo_url: str,
+    pdf_path: str = "",
+    audit_type: str = "peer",
 ) -> Dict[str, Any]:
     """
     Run a complete forensic audit.
@@ -370,17 +481,18 @@ def run_audit(
     Returns:
         Final AgentState dict with final_report populated.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    )
+    # .env must be applied before any node reads provider, tracing or cache settings
+    load_once()
+
+    # Respect logging already configured by the caller (notebooks, pytest, ...)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format=_LOG_FMT)
 
-    logger.info("\n%s", "=" * 60)
-    logger.info("🏛  AUTOMATON AUDITOR — Starting Audit")
-    logger.info("   Repo:  %s", repo_url)
-    logger.info("   PDF:   %s", pdf_path or "Not provided")
-    logger.info("   Type:  %s", audit_type)
-    logger.info("%s\n", "=" * 60)
+    logger.info(
+        "\n%s\n🏛  AUTOMATON AUDITOR — Starting Audit\n"
+        "   Repo:  %s\n   PDF:   %s\n   Type:  %s\n%s\n",
+        _RULE, repo_url, pdf_path or "Not provided", audit_type, _RULE,
+    )
 
     compiled = compile_graph()
 
@@ -390,23 +502,28 @@ def run_audit(
         "audit_type":        audit_type,
         "rubric_dimensions": [],
         "synthesis_rules":   {},
+        "expected_dim_ids":  frozenset(),
         "evidences":         {},
         "opinions":          [],
         "errors":            [],
+        "failed_nodes":      [],
+        "completed_detectives": [],
         "final_report":      None,
         "repo_evidence":     None,
         "doc_evidence":      None,
         "vision_evidence":   None,
     }
 
-    final = compiled.invoke(initial)
+    # Detective nodes are coroutines, so the graph is driven asynchronously
+    final = await compiled.ainvoke(initial)
 
     ar = final.get("final_report")
-    if ar:
+    if ar and logger.isEnabledFor(logging.INFO):
         scores = [cr.final_score for cr in ar.criteria]
-        logger.info("\n%s", "=" * 60)
-        logger.info("🏁 Audit Complete — Scores: %s | Overall: %.1f/5.0", scores, ar.overall_score)
-        logger.info("%s\n", "=" * 60)
+        logger.info(
+            "\n%s\n🏁 Audit Complete — Scores: %s | Overall: %.1f/5.0\n%s\n",
+            _RULE, scores, ar.overall_score, _RULE,
+        )
 
     return final
 
@@ -416,12 +533,11 @@ def run_audit(
 # ─────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: python -m src.graph <github_url> [pdf_path] [self|peer|received]")
         sys.exit(1)
 
+    load_once()
     result = run_audit(
         repo_url=sys.argv[1],
         pdf_path=sys.argv[2] if len(sys.argv) > 2 else "",
@@ -430,6 +546,7 @@ if __name__ == "__main__":
 
     ar = result.get("final_report")
     if ar:
+        from src.nodes.justice import generate_markdown_report
         print(generate_markdown_report(ar))
     else:
         print("No report generated. Errors:", result.get("errors", []))
\ No newline at end of file
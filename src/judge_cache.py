@@ -0,0 +1,107 @@
+"""
+src/judge_cache.py
+──────────────────
+On-disk cache of judge verdicts keyed by a blake2b digest of everything
+that shapes the answer: provider, model, temperature, persona prompt,
+collected evidence and rubric dimension, plus KEY_VERSION for prompt
+templates and schemas that live in code. Any change to the evidence or a
+prompt produces a new key, so stale verdicts are never served; entries
+also expire after JUDGE_CACHE_TTL seconds (default 24h).
+
+Opt-in with JUDGE_CACHE=1: re-running an audit on an unchanged repo then
+turns all 30 judge calls into SQLite lookups. VisionInspector stores its
+per-batch diagram verdicts here too, keyed by the image bytes. The store
+lives in the user cache directory (JUDGE_CACHE_DIR overrides it).
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a prompt template or output schema defined in code changes
+KEY_VERSION = "2"
+_DEFAULT_TTL = 86400.0
+_CONN: Optional[sqlite3.Connection] = None
+_LOCK = threading.Lock()
+
+
+def enabled() -> bool:
+    """True only when JUDGE_CACHE is set to a truthy value (off by default)."""
+    return os.getenv("JUDGE_CACHE", "0").lower() in ("1", "true", "yes")
+
+
+def make_key(*parts: str) -> str:
+    """Stable digest of KEY_VERSION and the key parts (NUL-separated so parts cannot run together)."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in (KEY_VERSION, *parts):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _db_path() -> Path:
+    """JUDGE_CACHE_DIR, else the platform's per-user cache directory."""
+    base = os.getenv("JUDGE_CACHE_DIR")
+    if not base:
+        if os.name == "nt":
+            base = os.path.join(os.getenv("LOCALAPPDATA") or Path.home(), "automaton-auditor", "Cache")
+        else:
+            base = os.path.join(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache", "automaton-auditor")
+    return Path(base).expanduser() / "judge_cache.sqlite3"
+
+
+def _ttl() -> float:
+    raw = os.getenv("JUDGE_CACHE_TTL")
+    if not raw:
+        return _DEFAULT_TTL
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid JUDGE_CACHE_TTL=%r; using %.0fs", raw, _DEFAULT_TTL)
+        return _DEFAULT_TTL
+
+
+def _conn() -> sqlite3.Connection:
+    global _CONN
+    if _CONN is None:
+        path = _db_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _CONN = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        _CONN.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+    return _CONN
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached JSON for key, or None on miss/expiry/any DB error."""
+    try:
+        with _LOCK:
+            row = _conn().execute(
+                "SELECT value FROM verdicts WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning("Judge cache read failed: %s", exc)
+        return None
+    return row[0] if row else None
+
+
+def put(key: str, value: str) -> None:
+    """Store value under key for JUDGE_CACHE_TTL seconds. Failures are logged, never raised."""
+    ttl = _ttl()
+    try:
+        with _LOCK:
+            _conn().execute(
+                "INSERT OR REPLACE INTO verdicts (key, value, expires) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning("Judge cache write failed: %s", exc)
@@ -4,6 +4,9 @@ src/nodes/detectives.py
 Layer 1: The Detective Layer — Forensic Sub-Agents
 
 Three agents run in PARALLEL via LangGraph fan-out.
+The detectives are coroutines: the graph is driven with ainvoke() so all
+three share one event loop, and their blocking work (git, AST walks, PDF
+parsing) is pushed onto worker threads with asyncio.to_thread.
 They do NOT opinionate. They collect facts only.
 Output: structured Evidence objects stored under unique keys in state.evidences.
 
@@ -17,23 +20,24 @@ Ollama Integration:
 - VisionInspector uses Ollama multimodal models when available
 - Falls back gracefully if vision models not installed
 """
+import asyncio
+import atexit
 import logging
+import multiprocessing
 import os
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 from src.state import (
     AgentState, DocEvidence, Evidence, RepoEvidence, VisionEvidence,
 )
 from src.tools.repo_tools import (
-    analyze_graph_structure,
-    analyze_state_management,
-    analyze_structured_output,
-    analyze_tool_sandboxing,
+    analyze_repo_all,
     clone_repo_sandboxed,
     extract_git_history,
     scan_directory_for_python,
 )
-from src.tools.doc_tools import analyze_pdf_report
-from src.tools.vision_tools import analyze_diagrams, vision_evidence_to_evidence
+# doc_tools / vision_tools are imported inside their nodes so a repo-only
+# run never loads the PDF and vision stack.
 from src.config.langchain_config import get_detective_llm
 
 logger = logging.getLogger(__name__)
@@ -53,12 +57,44 @@ TARGET_TO_KEYS = {
     "pdf_images": ["swarm_visual"],
 }
 
+# Every evidence key the Targeting Protocol expects, flattened once at import.
+_EXPECTED_KEYS = frozenset(k for keys in TARGET_TO_KEYS.values() for k in keys)
+
+# AST protocols are pure-Python CPU work, so large repos run them in a
+# worker process to escape the GIL. The pool is created on first use and
+# shared by every audit in this process. "spawn" avoids forking a
+# multi-threaded parent, but each worker re-imports the package, so small
+# repos (the common one-shot CLI case) are parsed in-process instead.
+_CPU_POOL: Optional[ProcessPoolExecutor] = None
+_MAX_CPU_WORKERS = 4
+_POOL_MIN_FILES = 200
+
+
+def _cpu_pool() -> ProcessPoolExecutor:
+    global _CPU_POOL
+    if _CPU_POOL is None:
+        _CPU_POOL = ProcessPoolExecutor(
+            max_workers=min(_MAX_CPU_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        atexit.register(_CPU_POOL.shutdown, wait=True)
+    return _CPU_POOL
+
+
+async def _analyze_repo(repo_path: str) -> Dict[str, Evidence]:
+    """analyze_repo_all in the process pool for large repos, on a thread otherwise."""
+    n_files = len(await asyncio.to_thread(scan_directory_for_python, repo_path, _POOL_MIN_FILES))
+    if n_files < _POOL_MIN_FILES:
+        return await asyncio.to_thread(analyze_repo_all, repo_path)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_cpu_pool(), analyze_repo_all, repo_path)
+
 
 # ─────────────────────────────────────────────────────────────
 # DETECTIVE 1: RepoInvestigator
 # ─────────────────────────────────────────────────────────────
 
-def repo_investigator_node(state: AgentState) -> dict:
+async def repo_investigator_node(state: AgentState) -> dict:
     """
     RepoInvestigator — The Code Detective.
     
@@ -80,13 +116,15 @@ def repo_investigator_node(state: AgentState) -> dict:
     if not repo_url:
         return {
             "errors": ["RepoInvestigator: no repo_url in state"],
+            "failed_nodes": ["RepoInvestigator"],
+            "completed_detectives": ["RepoInvestigator"],
             "evidences": {
                 "git_forensic_analysis": [_missing_evidence("Clone repository", "no url")],
             },
         }
 
     logger.info("🔍 RepoInvestigator: cloning %s", repo_url)
-    repo_path, tmpdir = clone_repo_sandboxed(repo_url)
+    repo_path, tmpdir = await asyncio.to_thread(clone_repo_sandboxed, repo_url)
 
     if not repo_path:
         fail = Evidence(
@@ -100,28 +138,30 @@ def repo_investigator_node(state: AgentState) -> dict:
         )
         return {
             "errors": [f"RepoInvestigator: failed to clone {repo_url}"],
+            "failed_nodes": ["RepoInvestigator"],
+            "completed_detectives": ["RepoInvestigator"],
             "evidences": {"git_forensic_analysis": [fail]},
         }
 
     try:
-        logger.info("  Protocol A: Git History")
-        git_ev = extract_git_history(repo_path)
-
-        logger.info("  Protocol B: State Management")
-        state_ev = analyze_state_management(repo_path)
-
-        logger.info("  Protocol C: Graph Orchestration")
-        graph_ev = analyze_graph_structure(repo_path)
-
-        logger.info("  Protocol D: Tool Sandboxing")
-        tools_ev = analyze_tool_sandboxing(repo_path)
-
-        logger.info("  Protocol E: Structured Output")
-        output_ev = analyze_structured_output(repo_path)
+        # Git history (subprocess I/O, thread) runs alongside B–E. B–E share
+        # one directory walk and one parse per file, so they run as a single
+        # fused job (process pool for large repos) rather than four walks.
+        logger.info("  Protocols A–E: git history, state, graph, tools, structured output")
+        git_ev, ast_evs = await asyncio.gather(
+            asyncio.to_thread(extract_git_history, repo_path),
+            _analyze_repo(repo_path),
+        )
+        state_ev = ast_evs["state_management_rigor"]
+        graph_ev = ast_evs["graph_orchestration"]
+        tools_ev = ast_evs["safe_tool_engineering"]
+        output_ev = ast_evs["structured_output_enforcement"]
 
+        # Every path starts with repo_path, so strip the prefix instead of relpath
+        prefix = repo_path.rstrip(os.sep) + os.sep
         py_files_rel = [
-            os.path.relpath(f, repo_path)
-            for f in scan_directory_for_python(repo_path)[:60]
+            f[len(prefix):] if f.startswith(prefix) else f
+            for f in scan_directory_for_python(repo_path, limit=60)
         ]
 
         repo_evidence = RepoEvidence(
@@ -140,6 +180,7 @@ def repo_investigator_node(state: AgentState) -> dict:
 
         return {
             "repo_evidence": repo_evidence,
+            "completed_detectives": ["RepoInvestigator"],
             "evidences": {
                 # Keys match rubric dimension IDs exactly
                 "git_forensic_analysis": [git_ev],
@@ -152,7 +193,10 @@ def repo_investigator_node(state: AgentState) -> dict:
 
     except Exception as exc:
         logger.error("RepoInvestigator crashed: %s", exc, exc_info=True)
-        return {"errors": [f"RepoInvestigator crashed: {exc}"]}
+        return {
+            "errors": [f"RepoInvestigator crashed: {exc}"],
+            "failed_nodes": ["RepoInvestigator"],
+        }
 
     finally:
         if tmpdir:
@@ -166,7 +210,7 @@ def repo_investigator_node(state: AgentState) -> dict:
 # DETECTIVE 2: DocAnalyst
 # ─────────────────────────────────────────────────────────────
 
-def doc_analyst_node(state: AgentState) -> dict:
+async def doc_analyst_node(state: AgentState) -> dict:
     """
     DocAnalyst — The Paperwork Detective.
     
@@ -190,12 +234,16 @@ def doc_analyst_node(state: AgentState) -> dict:
         missing = _missing_evidence("Read PDF report", pdf_path or "not provided")
         return {
             "errors": [f"DocAnalyst: PDF not found at '{pdf_path}'"],
+            "failed_nodes": ["DocAnalyst"],
+            "completed_detectives": ["DocAnalyst"],
             "evidences": {
                 "theoretical_depth": [missing],
                 "report_accuracy": [missing],
             },
         }
 
+    from src.tools.doc_tools import analyze_pdf_report
+
     # Best-effort: use repo file list if already in state (may be empty in parallel run)
     repo_ev = state.get("repo_evidence")
     repo_files = []
@@ -204,7 +252,9 @@ def doc_analyst_node(state: AgentState) -> dict:
         repo_files = repo_ev.raw_findings.get("python_files", [])
 
     try:
-        doc_evidence = analyze_pdf_report(pdf_path, repo_files, repo_root)
+        doc_evidence = await asyncio.to_thread(
+            analyze_pdf_report, pdf_path, repo_files, repo_root
+        )
 
         logger.info(
             "  ✅ DocAnalyst done: depth=%s hallucinations=%s",
@@ -214,6 +264,7 @@ def doc_analyst_node(state: AgentState) -> dict:
 
         return {
             "doc_evidence": doc_evidence,
+            "completed_detectives": ["DocAnalyst"],
             "evidences": {
                 "theoretical_depth": [doc_evidence.theoretical_depth],
                 "report_accuracy": [doc_evidence.hallucination_check],
@@ -221,7 +272,10 @@ def doc_analyst_node(state: AgentState) -> dict:
         }
     except Exception as exc:
         logger.error("DocAnalyst crashed: %s", exc, exc_info=True)
-        return {"errors": [f"DocAnalyst crashed: {exc}"]}
+        return {
+            "errors": [f"DocAnalyst crashed: {exc}"],
+            "failed_nodes": ["DocAnalyst"],
+        }
 
 
 # ─────────────────────────────────────────────────────────────
@@ -229,13 +283,18 @@ def doc_analyst_node(state: AgentState) -> dict:
 # ─────────────────────────────────────────────────────────────
 
 # In vision_inspector_node(), add Groq support for diagram analysis:
-def vision_inspector_node(state: AgentState) -> dict:
+async def vision_inspector_node(state: AgentState) -> dict:
     """VisionInspector with Groq fallback for diagram analysis."""
     pdf_path = state.get("pdf_path", "")
     logger.info("🖼️  VisionInspector: extracting diagrams from %s", pdf_path)
 
     if not pdf_path or not os.path.exists(pdf_path):
-        return {"errors": [f"VisionInspector: PDF not found at '{pdf_path}'"]}
+        return {
+            "errors": [f"VisionInspector: PDF not found at '{pdf_path}'"],
+            "failed_nodes": ["VisionInspector"],
+        }
+
+    from src.tools.vision_tools import analyze_diagrams_async, vision_evidence_to_evidence
 
     try:
         # Try Groq for vision analysis if available
@@ -245,7 +304,7 @@ def vision_inspector_node(state: AgentState) -> dict:
             # Groq doesn't support vision yet, use local fallback
             logger.info("  ℹ️  Groq vision not available, using local analysis")
         
-        vision_ev = analyze_diagrams(pdf_path)
+        vision_ev = await analyze_diagrams_async(pdf_path)
         evidence = vision_evidence_to_evidence(vision_ev)
 
         logger.info(
@@ -255,12 +314,16 @@ def vision_inspector_node(state: AgentState) -> dict:
 
         return {
             "vision_evidence": vision_ev,
+            "completed_detectives": ["VisionInspector"],
             "evidences": {"swarm_visual": [evidence]},
         }
         
     except Exception as exc:
         logger.error("VisionInspector crashed: %s", exc, exc_info=True)
-        return {"errors": [f"VisionInspector crashed: {exc}"]}
+        return {
+            "errors": [f"VisionInspector crashed: {exc}"],
+            "failed_nodes": ["VisionInspector"],
+        }
 # ─────────────────────────────────────────────────────────────
 # FAN-IN: EvidenceAggregator
 # ─────────────────────────────────────────────────────────────
@@ -285,7 +348,7 @@ def evidence_aggregator_node(state: AgentState) -> dict:
     """
     evidences = state.get("evidences", {})
     errors = state.get("errors", [])
-    dims = state.get("rubric_dimensions", [])
+    expected = state.get("expected_dim_ids") or _EXPECTED_KEYS
 
     ev_count = sum(len(v) for v in evidences.values())
     logger.info(
@@ -294,19 +357,20 @@ def evidence_aggregator_node(state: AgentState) -> dict:
     )
 
     if errors:
-        logger.warning("  ⚠  %d detective errors: %s", len(errors), errors[:3])
+        logger.warning("  ⚠  %d detective errors: %.200s", len(errors), errors)
 
-    # Targeting Protocol: check coverage per dimension
-    for dim in dims:
-        dim_id = dim.get("id", "")
-        if dim_id and dim_id not in evidences:
-            logger.warning("  ⚠  No evidence for dimension '%s'", dim_id)
+    # Targeting Protocol: check coverage per dimension (one set difference)
+    for dim_id in sorted(expected - evidences.keys()):
+        logger.warning("  ⚠  No evidence for dimension '%s'", dim_id)
 
-    # Forensic summary log
-    for key in sorted(evidences):
-        for ev in evidences[key]:
-            icon = "✅" if ev.found else "❌"
-            logger.info("  %s [%s] conf=%.2f: %s", icon, key, ev.confidence, ev.rationale[:80])
+    # Forensic summary log (skipped entirely when INFO is filtered out)
+    if logger.isEnabledFor(logging.INFO):
+        for key in sorted(evidences):
+            for ev in evidences[key]:
+                logger.info(
+                    "  %s [%s] conf=%.2f: %.80s",
+                    "✅" if ev.found else "❌", key, ev.confidence, ev.rationale,
+                )
 
     return {}  # Fan-in checkpoint — no state mutation needed
 
@@ -315,6 +379,12 @@ def evidence_aggregator_node(state: AgentState) -> dict:
 # HELPERS
 # ─────────────────────────────────────────────────────────────
 
+# Shared strings for every "missing input" Evidence object
+_TAG_MISSING = "missing"
+_MISSING_CONTENT = "Not provided"
+_MISSING_RATIONALE = "Input was empty or the file did not exist"
+
+
 def _missing_evidence(goal: str, location: str) -> Evidence:
     """
     Create a standardized Evidence object for missing inputs.
@@ -329,9 +399,9 @@ def _missing_evidence(goal: str, location: str) -> Evidence:
     return Evidence(
         goal=goal,
         found=False,
-        content="Not provided",
+        content=_MISSING_CONTENT,
         location=location,
-        rationale="Input was empty or the file did not exist",
+        rationale=_MISSING_RATIONALE,
         confidence=0.99,
-        tags=["missing"],
+        tags=[_TAG_MISSING],
     )
\ No newline at end of file
@@ -10,97 +10,129 @@ TechLead    →  "Does it actually work? Is it maintainable?"
 
 All judges use .with_structured_output(JudicialOpinion) to enforce
 Pydantic validation. Free-text responses trigger a retry (up to 3x).
+Within a judge, criteria are fanned out with asyncio.gather, bounded
+by JUDGE_CONCURRENCY in-flight requests.
 
 Ollama Integration:
 - Uses langchain_ollama.ChatOllama for local execution
 - Falls back to OpenAI/Anthropic if configured
 - Model selection via environment variables
 """
+import asyncio
+import functools
+import json
 import logging
+import operator
 import os
-from typing import Dict, List, Optional
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
 from langchain_core.messages import HumanMessage, SystemMessage
-from src.state import AgentState, Evidence, JudicialOpinion
-from src.config.langchain_config import get_judge_llm
+from pydantic import ValidationError
+from src.state import AgentState, Evidence, JudicialBench, JudicialOpinion
+from src import judge_cache
+from src._env import env_int
+from src.config.langchain_config import _env, get_judge_llm, get_llm
 
 logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 
+# Providers whose chat API accepts per-request `seed`/`temperature` kwargs.
+# Retries on these draw a fresh sample instead of replaying the same one.
+_SEEDED_PROVIDERS = frozenset({"groq", "openai", "vllm"})
+
+# Charges that mark a synthetic fallback rather than a real verdict
+_FALLBACK_CHARGES = frozenset({"LLM_UNAVAILABLE", "PARSE_FAILURE"})
+
 
 # ─────────────────────────────────────────────────────────────
 # LLM FACTORY (Ollama-First with Fallback)
 # ─────────────────────────────────────────────────────────────
 
+# Chat clients are memoised by get_llm; binding the output schema is
+# cached here per (provider, temperature, schema), so both are paid once.
+_STRUCTURED_CACHE: Dict[Tuple[str, float, type], Any] = {}
+
+
+def _provider() -> str:
+    """LLM_PROVIDER from langchain_config's environment snapshot, so a
+    _reload_env() moves client lookup, schema binding and cache keys together."""
+    return _env().llm_provider
+
+
 def _get_llm(temperature: float = 0.4):
     """
-    Return LLM with provider priority: Groq → Ollama → OpenAI → Anthropic.
-    FIXED: Proper Groq initialization without URL duplication.
+    Return the judge LLM for LLM_PROVIDER (groq | ollama | vllm | openai |
+    anthropic). get_llm caches the client for the process lifetime.
     """
-    provider = os.getenv("LLM_PROVIDER", "groq")
-    
-    try:
-        if provider == "groq":
-            from langchain_groq import ChatGroq
-            
-            api_key = os.getenv("GROQ_API_KEY")
-            if not api_key:
-                raise EnvironmentError("GROQ_API_KEY not set")
-            
-            model = os.getenv("GROQ_JUDGE_MODEL", "llama3-8b-8192")
-            
-            logger.info("🚀 Initializing Groq Judge: %s", model)
-            
-            # ✅ FIXED: No base_url parameter - ChatGroq handles it internally
-            return ChatGroq(
-                model=model,
-                temperature=temperature,
-                api_key=api_key,
-                timeout=120,  # Increased for reliability
-                max_retries=2,
-            )
-        
-        elif provider == "ollama":
-            from langchain_ollama import ChatOllama
-            model = os.getenv("OLLAMA_JUDGE_MODEL", "llama3.1:8b")
-            return ChatOllama(
-                model=model,
-                temperature=temperature,
-                base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-                num_ctx=4096,
-                timeout=300,
-            )
-        
-        elif provider == "openai":
-            from langchain_openai import ChatOpenAI
-            return ChatOpenAI(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-                temperature=temperature,
-                api_key=os.getenv("OPENAI_API_KEY"),
-                timeout=60,
-            )
-        
-        elif provider == "anthropic":
-            from langchain_anthropic import ChatAnthropic
-            return ChatAnthropic(
-                model=os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307"),
-                temperature=temperature,
-                api_key=os.getenv("ANTHROPIC_API_KEY"),
-                timeout=60,
-            )
-        
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
-    
-    except ImportError as exc:
-        logger.error("LLM package not installed: %s", exc)
-        raise
-    except Exception as exc:
-        logger.error("LLM initialization failed: %s", exc)
-        raise
+    return _build_llm(_provider(), temperature)
+
+
+# Structured-output backend per provider. json_schema gets server-side
+# constrained decoding (OpenAI structured outputs, Ollama's format=schema
+# grammar); Groq and Anthropic judge models only guarantee tool calling.
+_STRUCTURED_METHOD = {
+    "openai": "json_schema",
+    "ollama": "json_schema",
+    "vllm": "json_schema",
+    "groq": "function_calling",
+    "anthropic": "function_calling",
+}
+
+
+def _get_structured_llm(temperature: float = 0.4, schema: type = JudicialOpinion):
+    """Return the cached judge client already bound to schema."""
+    llm = _get_llm(temperature)
+    provider = _provider()
+    key = (provider, temperature, schema)
+    structured = _STRUCTURED_CACHE.get(key)
+    if structured is None:
+        method = _STRUCTURED_METHOD.get(provider, "function_calling")
+        structured = _STRUCTURED_CACHE[key] = llm.with_structured_output(schema, method=method)
+    return structured
+
+
+# Judge model and client timeout per provider; everything else (keys, URLs,
+# provider defaults) comes from the shared factory in langchain_config.
+_JUDGE_MODEL_ENV = {
+    "groq": ("GROQ_JUDGE_MODEL", "llama3-8b-8192"),
+    "ollama": ("OLLAMA_JUDGE_MODEL", "llama3.1:8b"),
+}
+_JUDGE_TIMEOUT = {"groq": 120, "ollama": 300, "vllm": 300}
+
+
+def _build_llm(provider: str, temperature: float):
+    """Construct the judge chat client for provider via get_llm."""
+    model_env = _JUDGE_MODEL_ENV.get(provider)
+    model = os.getenv(*model_env) if model_env else None
+    return get_llm(
+        provider=provider,
+        model_name=model,
+        temperature=temperature,
+        timeout=_JUDGE_TIMEOUT.get(provider, 60),
+    )
+
+
 # ─────────────────────────────────────────────────────────────
 # SYSTEM PROMPTS (Deliberately Distinct — No Shared Boilerplate)
 # ─────────────────────────────────────────────────────────────
 
+# The output contract is the one block every persona shares; it lives
+# here once and is appended to each persona brief.
+_JSON_CONTRACT = """
+You MUST return a valid JudicialOpinion JSON object with these exact fields:
+- judge: "{judge}"
+- criterion_id: the rubric dimension ID being evaluated
+- score: integer 1-5
+- argument: {argument}
+- cited_evidence: list of evidence keys supporting your argument
+- charges: {charges}
+"""
+
+
+def _json_contract(judge: str, argument: str, charges: str) -> str:
+    return _JSON_CONTRACT.format(judge=judge, argument=argument, charges=charges)
+
+
 PROSECUTOR_SYSTEM = """
 You are THE PROSECUTOR in a Digital Courtroom auditing an AI engineering submission.
 
@@ -125,15 +157,11 @@ SENTENCING GUIDELINES:
 - Single init commit → Git Forensic Analysis score MAX 2
 
 Be aggressive. The burden of proof is on the defendant. Evidence not found = not implemented.
-
-You MUST return a valid JudicialOpinion JSON object with these exact fields:
-- judge: "Prosecutor"
-- criterion_id: the rubric dimension ID being evaluated
-- score: integer 1-5
-- argument: your full legal reasoning
-- cited_evidence: list of evidence keys supporting your argument
-- charges: list of violations you are charging
-"""
+""" + _json_contract(
+    judge="Prosecutor",
+    argument="your full legal reasoning",
+    charges="list of violations you are charging",
+)
 
 DEFENSE_SYSTEM = """
 You are THE DEFENSE ATTORNEY in a Digital Courtroom auditing an AI engineering submission.
@@ -155,15 +183,11 @@ SCORING MANDATE:
 - Find the highest DEFENSIBLE score for each criterion
 - Benefit of the doubt on ambiguous evidence
 - Effort and deep thought deserve more credit than copy-pasted working code
-
-You MUST return a valid JudicialOpinion JSON object with these exact fields:
-- judge: "Defense"
-- criterion_id: the rubric dimension ID being evaluated
-- score: integer 1-5
-- argument: your full legal reasoning
-- cited_evidence: list of evidence keys supporting your argument
-- charges: empty list (you defend, you don't charge)
-"""
+""" + _json_contract(
+    judge="Defense",
+    argument="your full legal reasoning",
+    charges="empty list (you defend, you don't charge)",
+)
 
 TECH_LEAD_SYSTEM = """
 You are THE TECH LEAD in a Digital Courtroom auditing an AI engineering submission.
@@ -188,169 +212,324 @@ If Prosecutor says 1 and Defense says 5 — assess the actual technical debt obj
 Score 1, 3, or 5 based on whether the CORE requirement was met.
 
 Provide specific file-level remediation instructions.
-
-You MUST return a valid JudicialOpinion JSON object with these exact fields:
-- judge: "TechLead"
-- criterion_id: the rubric dimension ID being evaluated
-- score: integer 1-5
-- argument: your full technical assessment
-- cited_evidence: list of evidence keys supporting your argument
-- charges: empty list (you evaluate, you don't charge)
-"""
+""" + _json_contract(
+    judge="TechLead",
+    argument="your full technical assessment",
+    charges="empty list (you evaluate, you don't charge)",
+)
 
 
 # ─────────────────────────────────────────────────────────────
 # EVIDENCE FORMATTER
 # ─────────────────────────────────────────────────────────────
+# The collected evidence is identical for every criterion, so it is
+# rendered once per judge and sent as the prompt prefix; only the short
+# criterion brief varies. Keeping the stable text first lets provider
+# prompt caches (Anthropic cache_control, OpenAI automatic prefix
+# caching) serve criteria 2..N from cache.
+
+_EVIDENCE_LEGEND = (
+    "[key] found confidence | location | goal | rationale | tags"
+    "   (↳ content preview, low-confidence items only)"
+)
+_PREVIEW_CHARS = 300
+_PREVIEW_CONFIDENCE = 0.7
+
+
+_EVIDENCE_FIELDS = operator.attrgetter(
+    "found", "goal", "confidence", "location", "rationale", "content", "tags"
+)
+# Defaults for hand-built dict evidence (tests, external states)
+_EVIDENCE_DEFAULTS = {
+    "found": False, "goal": "N/A", "confidence": 0.0, "location": "N/A",
+    "rationale": "N/A", "content": "", "tags": [],
+}
 
-def _format_evidence(state: AgentState, criterion: Dict) -> str:
+
+def _as_evidence(ev: Dict) -> Evidence:
+    """Lift a plain evidence dict into an Evidence without re-validating it."""
+    return Evidence.model_construct(**{**_EVIDENCE_DEFAULTS, **ev})
+
+
+def _evidence_rows(evidences: Dict) -> Tuple[Tuple, ...]:
     """
-    Build the evidence block passed to each judge for one criterion.
+    Every evidence item as a hashable (key, *fields) row, in prompt order.
     Handles both Evidence Pydantic objects AND plain dicts for flexibility.
     """
-    evidences = state.get("evidences", {})
+    rows = []
+    for key, ev_list in sorted(evidences.items()):
+        for ev in ev_list:
+            ev = ev if isinstance(ev, Evidence) else _as_evidence(ev)
+            found, goal, confidence, location, rationale, content, tags = _EVIDENCE_FIELDS(ev)
+            rows.append((key, found, goal, confidence, location, rationale, content, tuple(tags or ())))
+    return tuple(rows)
+
+
+# The three judges render the same evidence, so the prefix is cached by the
+# evidence content itself: a mutated or different state is a different key.
+@functools.lru_cache(maxsize=8)
+def _render_evidence(rows: Tuple[Tuple, ...]) -> str:
+    """Render every collected evidence item — the criterion-independent prefix."""
+    lines = ["=== COLLECTED EVIDENCE ===", _EVIDENCE_LEGEND]
+    for key, found, goal, confidence, location, rationale, content, tags in rows:
+        # One positional row per item; the legend above names the
+        # columns once instead of repeating seven labels per item.
+        row = (
+            f"[{key}] {'✅' if found else '❌'} {confidence:.2f} | {location} | "
+            f"{goal} | {rationale} | {', '.join(tags) if tags else '-'}"
+        )
+        # Prose preview only where the detective itself was unsure
+        if content and confidence < _PREVIEW_CONFIDENCE:
+            row += f"\n    ↳ {content[:_PREVIEW_CHARS]}{'…' if len(content) > _PREVIEW_CHARS else ''}"
+        lines.append(row)
+
+    return "\n".join(lines)
+
+
+def build_evidence_prefix(state: AgentState) -> str:
+    """The evidence prompt prefix shared by every judge (see _render_evidence)."""
+    return _render_evidence(_evidence_rows(state.get("evidences", {})))
+
+
+def _criterion_row(criterion: Dict) -> Tuple:
+    """The fields a brief is rendered from, as a hashable row."""
+    return (
+        criterion["name"],
+        criterion["id"],
+        criterion["target_artifact"],
+        criterion.get("forensic_instruction", "See rubric"),
+        criterion.get("success_pattern", " "),
+        criterion.get("failure_pattern", " "),
+        tuple(criterion.get("judicial_logic", {}).items()),
+    )
+
+
+# Every judge, and every later audit against the same rubric, asks for the
+# same briefs, so they are cached by content like the evidence prefix.
+@functools.lru_cache(maxsize=64)
+def _render_criterion(row: Tuple) -> str:
+    """Build the per-criterion forensic brief and judicial logic (the varying suffix)."""
+    name, cid, target, instruction, success, failure, judicial_logic = row
     lines = [
-        f"=== FORENSIC BRIEF: {criterion['name']} (ID: {criterion['id']}) ===",
-        f"Target Artifact: {criterion['target_artifact']}",
+        f"=== FORENSIC BRIEF: {name} (ID: {cid}) ===",
+        f"Target Artifact: {target}",
         " ",
         "FORENSIC INSTRUCTION:",
-        criterion.get("forensic_instruction", "See rubric"),
+        instruction,
         " ",
         "SUCCESS PATTERN:",
-        criterion.get("success_pattern", " "),
+        success,
         " ",
         "FAILURE PATTERN:",
-        criterion.get("failure_pattern", " "),
+        failure,
         " ",
-        "=== COLLECTED EVIDENCE ===",
+        "=== YOUR JUDICIAL LOGIC FOR THIS CRITERION ===",
     ]
-    
-    for key, ev_list in sorted(evidences.items()):
-        for ev in ev_list:
-            # Handle both Evidence object AND plain dict
-            if isinstance(ev, dict):
-                # Dict access
-                found = ev.get("found", False)
-                goal = ev.get("goal", "N/A")
-                confidence = ev.get("confidence", 0.0)
-                location = ev.get("location", "N/A")
-                rationale = ev.get("rationale", "N/A")
-                content = ev.get("content", "")
-                tags = ev.get("tags", [])
-            else:
-                # Pydantic Evidence object access
-                found = ev.found
-                goal = ev.goal
-                confidence = ev.confidence
-                location = ev.location
-                rationale = ev.rationale
-                content = ev.content if hasattr(ev, 'content') else ""
-                tags = ev.tags if hasattr(ev, 'tags') else []
-            
-            icon = "✅" if found else "❌"
-            lines.append(f"\n[{key}] {icon}")
-            lines.append(f"  Goal:       {goal}")
-            lines.append(f"  Found:      {found}")
-            lines.append(f"  Confidence: {confidence:.2f}")
-            lines.append(f"  Location:   {location}")
-            lines.append(f"  Rationale:  {rationale}")
-            if content:
-                preview = content[:600] + ("…" if len(content) > 600 else "")
-                lines.append(f"  Content:    {preview}")
-            if tags:
-                lines.append(f"  Tags:       {', '.join(tags)}")
-
-    lines.append("\n=== YOUR JUDICIAL LOGIC FOR THIS CRITERION ===")
-    jl = criterion.get("judicial_logic", {})
-    for role, instruction in jl.items():
-        lines.append(f"\n{role.upper()}: {instruction}")
+    for role, text in judicial_logic:
+        lines.append(f"\n{role.upper()}: {text}")
 
     return "\n".join(lines)
 
 
+def criterion_brief(criterion: Dict) -> str:
+    """Render one rubric dimension's brief (see _render_criterion)."""
+    return _render_criterion(_criterion_row(criterion))
+
+
+def _cacheable(text: str, provider: str):
+    """Mark text as a cache breakpoint where the provider supports it explicitly."""
+    if provider == "anthropic":
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+    return text
+
+
+@functools.lru_cache(maxsize=8)
+def _system_message(system_prompt: str, provider: str) -> SystemMessage:
+    """One SystemMessage per (persona prompt, provider), reused across runs."""
+    return SystemMessage(content=_cacheable(system_prompt, provider))
+
+
+def _prompt_head(system_prompt: str, evidence_prefix: str) -> list:
+    """System prompt + collected evidence: the message prefix shared by every criterion."""
+    provider = _provider()
+    return [
+        _system_message(system_prompt, provider),
+        HumanMessage(content=_cacheable(evidence_prefix, provider)),
+    ]
+
+
+HUMAN_TEMPLATE = (
+    "Render your verdict on criterion: {cid}\n\n"
+    "{brief}\n\n"
+    "Your 'judge' field MUST be exactly: \"{persona}\"\n"
+    "Your 'criterion_id' MUST be exactly: \"{cid}\"\n"
+    "Return a JudicialOpinion JSON object now."
+)
+
+
 # ─────────────────────────────────────────────────────────────
 # JUDGE INVOCATION WITH STRUCTURED OUTPUT + RETRY
 # ─────────────────────────────────────────────────────────────
 
-def _invoke_judge(
+def fallback_opinion(
     persona: str,
-    system_prompt: str,
-    evidence_block: str,
     criterion_id: str,
-) -> Optional[JudicialOpinion]:
+    reason: object,
+    charge: str = "LLM_UNAVAILABLE",
+) -> JudicialOpinion:
+    """Deterministic score-3 opinion used when no valid verdict could be obtained."""
+    return JudicialOpinion(
+        judge=persona,  # type: ignore[arg-type]
+        criterion_id=criterion_id,
+        score=3,
+        argument=f"[{charge.replace('_', ' ')}] Default score assigned. {reason}",
+        cited_evidence=[],
+        charges=[charge],
+    )
+
+
+async def _invoke_judge(
+    structured_llm,
+    limiter: asyncio.Semaphore,
+    persona: str,
+    head: list,
+    criterion_block: str,
+    criterion_id: str,
+    cache_key: Optional[str] = None,
+) -> JudicialOpinion:
     """
     Call a judge LLM with structured output enforcement.
     Retries up to MAX_RETRIES times if output is not valid Pydantic.
     
     Args:
+        structured_llm: LLM already bound to the JudicialOpinion schema
+        limiter: Semaphore bounding in-flight requests for this judge
         persona: Judge persona name ("Prosecutor", "Defense", or "TechLead")
-        system_prompt: System prompt for the judge persona
-        evidence_block: Formatted evidence context
+        head: Shared system prompt + collected evidence messages
+        criterion_block: Formatted brief for this criterion
         criterion_id: Rubric dimension ID being evaluated
+        cache_key: judge_cache key; a valid verdict is checkpointed under it
+            the moment it arrives, so an interrupted run resumes from there
         
     Returns:
-        JudicialOpinion object or None if all retries fail
+        JudicialOpinion — the model's verdict, or a score-3 fallback charged
+        LLM_UNAVAILABLE (connection/config errors) or PARSE_FAILURE
     """
-    try:
-        # Get LLM with Ollama integration
-        llm = _get_llm(temperature=0.4)
-        structured_llm = llm.with_structured_output(JudicialOpinion)
-        
-        human = (
-            f"Render your verdict on criterion: {criterion_id}\n\n"
-            f"{evidence_block}\n\n"
-            f"Your 'judge' field MUST be exactly: \"{persona}\"\n"
-            f"Your 'criterion_id' MUST be exactly: \"{criterion_id}\"\n"
-            f"Return a JudicialOpinion JSON object now."
+    human = HUMAN_TEMPLATE.format(cid=criterion_id, brief=criterion_block, persona=persona)
+    messages = [*head, HumanMessage(content=human)]
+    reseed = _provider() in _SEEDED_PROVIDERS
+    base_seed = zlib.crc32(criterion_id.encode())
+    last_exc: Optional[Exception] = None
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        # Silent retry: the prompt never carries the prior failure, but
+        # the seed (and a slightly higher temperature) rotate per attempt.
+        overrides = {}
+        if reseed and attempt > 1:
+            overrides = {
+                "seed": (attempt * 1009 + base_seed) & 0xFFFFFFFF,
+                "temperature": min(0.4 + 0.2 * (attempt - 1), 0.9),
+            }
+        try:
+            async with limiter:
+                result = await structured_llm.ainvoke(messages, **overrides)
+        except Exception as exc:
+            logger.warning("  %s attempt %d failed: %s", persona, attempt, exc)
+            last_exc = exc
+            continue
+
+        if isinstance(result, JudicialOpinion):
+            logger.info(
+                "  ⚖  %s → %s: score=%d", 
+                persona, criterion_id, result.score
+            )
+            if cache_key:
+                judge_cache.put(cache_key, result.model_dump_json())
+            return result
+
+        logger.warning(
+            "  %s attempt %d: unexpected type %s", 
+            persona, attempt, type(result)
         )
+        last_exc = None
 
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                result = structured_llm.invoke([
-                    SystemMessage(content=system_prompt),
-                    HumanMessage(content=human),
-                ])
-                
-                if isinstance(result, JudicialOpinion):
-                    logger.info(
-                        "  ⚖  %s → %s: score=%d", 
-                        persona, criterion_id, result.score
-                    )
-                    return result
-                    
-                logger.warning(
-                    "  %s attempt %d: unexpected type %s", 
-                    persona, attempt, type(result)
-                )
-                
-            except Exception as exc:
-                logger.warning("  %s attempt %d failed: %s", persona, attempt, exc)
-                if attempt == MAX_RETRIES:
-                    raise
+    if isinstance(last_exc, EnvironmentError):
+        logger.error("LLM not configured: %s", last_exc)
+        return fallback_opinion(persona, criterion_id, last_exc)
 
-    except EnvironmentError as exc:
-        logger.error("LLM not configured: %s", exc)
-        # Deterministic fallback when no LLM is available
-        return JudicialOpinion(
-            judge=persona,  # type: ignore[arg-type]
-            criterion_id=criterion_id,
-            score=3,
-            argument=f"[LLM UNAVAILABLE] Default score assigned. {exc}",
-            cited_evidence=[],
-            charges=["LLM_UNAVAILABLE"],
+    logger.error(
+        "%s → %s: no valid opinion after %d attempts: %s",
+        persona, criterion_id, MAX_RETRIES, last_exc or "wrong output type",
+    )
+    return fallback_opinion(
+        persona, criterion_id, last_exc or "wrong output type", charge="PARSE_FAILURE"
+    )
+
+
+async def _invoke_bench(
+    structured_bench,
+    persona: str,
+    head: list,
+    dimensions: List[Dict],
+    briefs: Dict[str, str],
+) -> Dict[str, JudicialOpinion]:
+    """
+    Ask one judge for every criterion in a single JudicialBench call.
+
+    Returns the opinions keyed by criterion_id, keeping only ids that were
+    asked for; the caller retries anything missing one criterion at a time.
+    """
+    blocks = "\n\n".join(
+        f"<criterion id=\"{c['id']}\">\n{briefs[c['id']]}\n</criterion>"
+        for c in dimensions
+    )
+    human = (
+        f"Render your verdict on EVERY criterion below ({len(dimensions)} in total).\n\n"
+        f"{blocks}\n\n"
+        f"Every opinion's 'judge' field MUST be exactly: \"{persona}\"\n"
+        f"Each 'criterion_id' MUST match the id attribute of its <criterion> block.\n"
+        f"Return a JudicialBench JSON object with one opinion per criterion now."
+    )
+    messages = [*head, HumanMessage(content=human)]
+    wanted = {c["id"] for c in dimensions}
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            result = await structured_bench.ainvoke(messages)
+        except Exception as exc:
+            logger.warning("  %s batch attempt %d failed: %s", persona, attempt, exc)
+            continue
+        if isinstance(result, JudicialBench):
+            return {
+                op.criterion_id: op for op in result.opinions
+                if op.criterion_id in wanted and op.judge == persona
+            }
+        logger.warning(
+            "  %s batch attempt %d: unexpected type %s",
+            persona, attempt, type(result)
         )
-    except Exception as exc:
-        logger.error("%s failed after %d retries: %s", persona, MAX_RETRIES, exc)
-        return None
+    return {}
 
 
 # ─────────────────────────────────────────────────────────────
 # GENERIC JUDGE NODE FACTORY
 # ─────────────────────────────────────────────────────────────
 
-def _judge_node(state: AgentState, persona: str, system_prompt: str) -> dict:
+def _store_verdicts(opinions: Dict[str, JudicialOpinion], cache_keys: Dict[str, str]) -> None:
+    """Persist real verdicts; score-3 fallbacks are never cached."""
+    for cid, op in opinions.items():
+        key = cache_keys.get(cid)
+        if key and not _FALLBACK_CHARGES.intersection(op.charges):
+            judge_cache.put(key, op.model_dump_json())
+
+
+async def _judge_node(state: AgentState, persona: str, system_prompt: str) -> dict:
     """
-    Run one judicial persona across ALL 10 rubric criteria.
+    Run one judicial persona across ALL 10 rubric criteria concurrently.
+
+    The client is built once per node and every criterion is fanned out
+    with asyncio.gather; JUDGE_CONCURRENCY caps in-flight requests so
+    rate-limited providers are not flooded. Results keep rubric order.
     
     Args:
         state: Current AgentState
@@ -364,20 +543,78 @@ def _judge_node(state: AgentState, persona: str, system_prompt: str) -> dict:
     if not dimensions:
         return {"errors": [f"{persona}: No rubric dimensions in state"]}
 
-    opinions: List[JudicialOpinion] = []
-    
-    for criterion in dimensions:
-        evidence_block = _format_evidence(state, criterion)
-        opinion = _invoke_judge(
+    try:
+        structured_llm = _get_structured_llm(temperature=0.4)
+    except EnvironmentError as exc:
+        logger.error("LLM not configured: %s", exc)
+        return {"opinions": [fallback_opinion(persona, c["id"], exc) for c in dimensions]}
+    except Exception as exc:
+        logger.error("%s: LLM initialization failed: %s", persona, exc)
+        return {"opinions": [], "errors": [f"{persona}: LLM initialization failed: {exc}"]}
+
+    evidence_prefix = build_evidence_prefix(state)
+    head = _prompt_head(system_prompt, evidence_prefix)
+    briefs = {c["id"]: criterion_brief(c) for c in dimensions}
+
+    # Verdicts already on disk for this exact prompt/evidence/model skip the LLM
+    by_id: Dict[str, JudicialOpinion] = {}
+    cache_keys: Dict[str, str] = {}
+    if judge_cache.enabled():
+        llm = _get_llm(temperature=0.4)
+        base = judge_cache.make_key(
+            _provider(),
+            str(getattr(llm, "model_name", None) or getattr(llm, "model", "")),
+            "0.4", system_prompt, HUMAN_TEMPLATE, evidence_prefix,
+        )
+        for criterion in dimensions:
+            cid = criterion["id"]
+            # The whole rubric dimension, not just the brief: any rubric edit is a new key
+            rubric_entry = json.dumps(criterion, sort_keys=True, default=str)
+            cache_keys[cid] = key = judge_cache.make_key(base, persona, rubric_entry)
+            hit = judge_cache.get(key)
+            if hit is None:
+                continue
+            try:
+                by_id[cid] = JudicialOpinion.model_validate_json(hit)
+            except ValidationError as exc:
+                logger.warning("  %s → %s: stale cache entry ignored: %s", persona, cid, exc)
+        if by_id:
+            logger.info("  %s: %d/%d verdicts from cache", persona, len(by_id), len(dimensions))
+
+    pending = [c for c in dimensions if c["id"] not in by_id]
+
+    # JUDGE_BATCH=1 trades latency (one long decode) for cost: a single
+    # call per judge instead of one per criterion.
+    if pending and os.getenv("JUDGE_BATCH", "").lower() in ("1", "true", "yes"):
+        batched = await _invoke_bench(
+            _get_structured_llm(temperature=0.4, schema=JudicialBench),
+            persona, head, pending, briefs,
+        )
+        logger.info("  %s batch covered %d/%d criteria", persona, len(batched), len(pending))
+        _store_verdicts(batched, cache_keys)
+        by_id.update(batched)
+        pending = [c for c in pending if c["id"] not in batched]
+
+    # Created per call: a semaphore binds to the running loop, and each
+    # audit may run on a different loop (run_audit() starts a fresh one).
+    limiter = asyncio.Semaphore(env_int("JUDGE_CONCURRENCY", 8))
+
+    results = await asyncio.gather(*(
+        _invoke_judge(
+            structured_llm,
+            limiter,
             persona=persona,
-            system_prompt=system_prompt,
-            evidence_block=evidence_block,
+            head=head,
+            criterion_block=briefs[criterion["id"]],
             criterion_id=criterion["id"],
+            cache_key=cache_keys.get(criterion["id"]),
         )
-        if opinion:
-            opinions.append(opinion)
-        else:
-            logger.error("  %s: no opinion for %s", persona, criterion["id"])
+        for criterion in pending
+    ))
+    by_id.update((criterion["id"], opinion) for criterion, opinion in zip(pending, results))
+
+    # Every criterion now has an opinion (real or fallback) — keep rubric order
+    opinions: List[JudicialOpinion] = [by_id[c["id"]] for c in dimensions]
 
     logger.info(
         "  ✅ %s issued %d opinions across %d criteria", 
@@ -390,7 +627,7 @@ def _judge_node(state: AgentState, persona: str, system_prompt: str) -> dict:
 # JUDGE NODES (Registered in graph.py)
 # ─────────────────────────────────────────────────────────────
 
-def prosecutor_node(state: AgentState) -> dict:
+async def prosecutor_node(state: AgentState) -> dict:
     """
     The Prosecutor — finds violations, charges fraud, argues for low scores.
     
@@ -401,10 +638,10 @@ def prosecutor_node(state: AgentState) -> dict:
         Dict with prosecutor opinions
     """
     logger.info("⚔  Prosecutor: building case...")
-    return _judge_node(state, "Prosecutor", PROSECUTOR_SYSTEM)
+    return await _judge_node(state, "Prosecutor", PROSECUTOR_SYSTEM)
 
 
-def defense_node(state: AgentState) -> dict:
+async def defense_node(state: AgentState) -> dict:
     """
     The Defense Attorney — champions effort, intent, and spirit of the law.
     
@@ -415,10 +652,10 @@ def defense_node(state: AgentState) -> dict:
         Dict with defense opinions
     """
     logger.info("🛡  Defense: building defence...")
-    return _judge_node(state, "Defense", DEFENSE_SYSTEM)
+    return await _judge_node(state, "Defense", DEFENSE_SYSTEM)
 
 
-def tech_lead_node(state: AgentState) -> dict:
+async def tech_lead_node(state: AgentState) -> dict:
     """
     The Tech Lead — pragmatic tiebreaker focused on production viability.
     
@@ -429,4 +666,30 @@ def tech_lead_node(state: AgentState) -> dict:
         Dict with tech lead opinions
     """
     logger.info("🔧  TechLead: evaluating architecture...")
-    return _judge_node(state, "TechLead", TECH_LEAD_SYSTEM)
+    return await _judge_node(state, "TechLead", TECH_LEAD_SYSTEM)
+
+
+async def bench_node(state: AgentState) -> dict:
+    """
+    The whole bench in one call — all three personas concurrently.
+
+    For callers driving the judicial layer outside the graph (scripts,
+    smoke tests). graph.py keeps the three personas as separate nodes so
+    each keeps its own trace; under ainvoke they already run concurrently.
+    
+    Args:
+        state: Current AgentState
+        
+    Returns:
+        Dict with every judge's opinions (and any errors) merged
+    """
+    results = await asyncio.gather(
+        prosecutor_node(state),
+        defense_node(state),
+        tech_lead_node(state),
+    )
+    merged: dict = {"opinions": [op for r in results for op in r.get("opinions", [])]}
+    errors = [e for r in results for e in r.get("errors", [])]
+    if errors:
+        merged["errors"] = errors
+    return merged
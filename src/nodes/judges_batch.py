@@ -0,0 +1,150 @@
+"""
+src/nodes/judges_batch.py
+─────────────────────────
+Offline judicial bench via the OpenAI Batch API.
+
+For non-interactive audits (CI, nightly scans) the 30 judge×criterion
+calls have no inter-request dependencies, so they can be submitted as one
+batch job: ~50% of the synchronous price, parallelised inside provider
+infrastructure, results within the 24h completion window.
+
+    batch_id = submit_bench_batch(state)        # after EvidenceAggregator
+    ...
+    opinions = collect_bench_batch(batch_id)    # None while still running
+
+Prompts are byte-identical to the live judges (same system prompts,
+evidence prefix and criterion briefs), so verdicts are comparable.
+"""
+import io
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+from src._env import load_once
+from src.nodes.judges import (
+    DEFENSE_SYSTEM,
+    HUMAN_TEMPLATE,
+    PROSECUTOR_SYSTEM,
+    TECH_LEAD_SYSTEM,
+    build_evidence_prefix,
+    criterion_brief,
+    fallback_opinion,
+)
+from src.state import AgentState, JudicialOpinion
+
+logger = logging.getLogger(__name__)
+
+_BENCH: Tuple[Tuple[str, str], ...] = (
+    ("Prosecutor", PROSECUTOR_SYSTEM),
+    ("Defense", DEFENSE_SYSTEM),
+    ("TechLead", TECH_LEAD_SYSTEM),
+)
+_TERMINAL_FAILURES = frozenset({"failed", "expired", "cancelled"})
+
+
+def _client():
+    """OpenAI SDK client for the Files and Batches APIs."""
+    load_once()
+    try:
+        from openai import OpenAI
+    except ImportError as exc:
+        raise ImportError(
+            "Batch judging requires the 'openai' SDK. Install with: pip install openai"
+        ) from exc
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+def _response_format() -> Dict:
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": "JudicialOpinion", "schema": JudicialOpinion.model_json_schema()},
+    }
+
+
+def build_batch_requests(state: AgentState) -> List[Dict]:
+    """One /v1/chat/completions request per (judge, criterion), custom_id = 'persona:criterion_id'."""
+    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    evidence = build_evidence_prefix(state)
+    response_format = _response_format()
+    requests: List[Dict] = []
+    for criterion in state.get("rubric_dimensions", []):
+        cid = criterion["id"]
+        brief = criterion_brief(criterion)
+        for persona, system_prompt in _BENCH:
+            requests.append({
+                "custom_id": f"{persona}:{cid}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "temperature": 0.4,
+                    "response_format": response_format,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": evidence},
+                        {"role": "user", "content": HUMAN_TEMPLATE.format(
+                            cid=cid, brief=brief, persona=persona)},
+                    ],
+                },
+            })
+    return requests
+
+
+def submit_bench_batch(state: AgentState) -> str:
+    """Upload the bench as a JSONL batch file and start the job. Returns the batch id."""
+    requests = build_batch_requests(state)
+    if not requests:
+        raise ValueError("No rubric dimensions in state — nothing to submit")
+    payload = "\n".join(json.dumps(r, separators=(",", ":")) for r in requests)
+
+    client = _client()
+    upload = client.files.create(
+        file=("bench.jsonl", io.BytesIO(payload.encode("utf-8"))),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("📨 Submitted judicial bench batch %s (%d requests)", batch.id, len(requests))
+    return batch.id
+
+
+def collect_bench_batch(batch_id: str) -> Optional[List[JudicialOpinion]]:
+    """
+    Fetch results for a submitted bench.
+
+    Returns None while the batch is still running. Requests that errored or
+    returned unparseable output become PARSE_FAILURE fallback opinions, so
+    the list always covers every (judge, criterion) that was submitted.
+    """
+    client = _client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status in _TERMINAL_FAILURES:
+        raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+    if batch.status != "completed":
+        logger.info("⏳ Batch %s: %s", batch_id, batch.status)
+        return None
+
+    opinions: List[JudicialOpinion] = []
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            persona, _, cid = record["custom_id"].partition(":")
+            try:
+                body = record["response"]["body"]
+                content = body["choices"][0]["message"]["content"]
+                opinions.append(JudicialOpinion.model_validate_json(content))
+            except Exception as exc:
+                reason = record.get("error") or exc
+                logger.error("Batch result %s unusable: %s", record["custom_id"], reason)
+                opinions.append(fallback_opinion(persona, cid, reason, charge="PARSE_FAILURE"))
+
+    logger.info("✅ Batch %s returned %d opinions", batch_id, len(opinions))
+    return opinions
@@ -12,10 +12,12 @@ dissent_requirement    — variance > 2 MUST include dissent summary
 variance_re_evaluation — variance > 2 triggers cited-evidence re-examination first
 Report structure: Executive Summary → Criterion Breakdown → Remediation Plan
 """
+import io
 import logging
+import re
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from src.state import (
     AgentState, AuditReport, CriterionResult, Evidence, JudicialOpinion,
 )
@@ -27,34 +29,36 @@ logger = logging.getLogger(__name__)
 # SECURITY VIOLATION DETECTION
 # ─────────────────────────────────────────────────────────────
 
-_SECURITY_TAGS = {
+_SECURITY_TAGS: FrozenSet[str] = frozenset({
     "Security Negligence", "security violation", "shell injection",
     "os.system", "unsanitized", "raw os.system",
-}
+})
+# One case-insensitive alternation: a single C-level scan per charge
+_SECURITY_RE = re.compile("|".join(map(re.escape, _SECURITY_TAGS)), re.IGNORECASE)
+_SECURITY_ARG_RE = re.compile("security", re.IGNORECASE)
 
 
-def _has_security_violation(opinions: List[JudicialOpinion]) -> bool:
+def _has_security_violation(op: JudicialOpinion) -> bool:
     """
     Rule of Security: Prosecutor must have charged a confirmed security vulnerability.
     Detects via charge strings OR (score ≤ 2 AND 'security' in argument).
     """
-    for op in opinions:
-        if op.judge != "Prosecutor":
-            continue
-        for charge in op.charges:
-            if any(tag.lower() in charge.lower() for tag in _SECURITY_TAGS):
-                return True
-        if op.score <= 2 and "security" in op.argument.lower():
+    if op.judge != "Prosecutor":
+        return False
+    for charge in op.charges:
+        # Canonical charge strings (as the Prosecutor prompt words them) hit
+        # the O(1) hash lookup; anything else falls back to the regex scan.
+        if charge in _SECURITY_TAGS or _SECURITY_RE.search(charge):
             return True
-    return False
+    return op.score <= 2 and _SECURITY_ARG_RE.search(op.argument) is not None
 
 
-def _has_defense_hallucination(opinions: List[JudicialOpinion], evidences: dict) -> bool:
+def _has_defense_hallucination(doc_evs: List[Evidence]) -> bool:
     """
     Rule of Evidence (fact_supremacy): if Defense claims deep metacognition
     but the PDF was never found, the Defense is overruled.
+    Takes the theoretical_depth evidence; evaluated once per audit.
     """
-    doc_evs = evidences.get("theoretical_depth", [])
     for ev in doc_evs:
         if not ev.found and "not found" in ev.rationale.lower():
             return True
@@ -67,7 +71,7 @@ def _has_defense_hallucination(opinions: List[JudicialOpinion], evidences: dict)
 
 def _resolve_scores(
     p: int, d: int, t: int, criterion_id: str,
-) -> Tuple[int, str, bool]:
+) -> Tuple[int, str, bool, int]:
     """
     Hardcoded Python conflict resolution — NOT an LLM prompt.
     Ladder (in priority order):
@@ -75,7 +79,7 @@ def _resolve_scores(
       variance == 2 → TechLead tiebreaker (Rule of Functionality)
       variance  >  2 → re-evaluation flag set; TechLead×2 weighted average
 
-    Returns (final_score, method_description, needs_re_evaluation)
+    Returns (final_score, method_description, needs_re_evaluation, variance)
     """
     variance = max(p, d, t) - min(p, d, t)
     needs_re_eval = variance > 2
@@ -95,7 +99,7 @@ def _resolve_scores(
             f"({p} + {t*2} + {d}) / 4 = {final}"
         )
 
-    return final, method, needs_re_eval
+    return final, method, needs_re_eval, variance
 
 
 # ─────────────────────────────────────────────────────────────
@@ -104,18 +108,20 @@ def _resolve_scores(
 
 def _apply_overrides(
     score: int,
-    criterion_id: str,
-    opinions: List[JudicialOpinion],
-    evidences: dict,
-) -> Tuple[int, List[str]]:
+    sec_viol: bool,
+    defense_hallucinated: bool,
+    defense_score: Optional[int],
+) -> Tuple[int, List[str], bool]:
     """
     Apply the three named constitutional override rules.
-    Returns (possibly_capped_score, list_of_applied_overrides).
+    The flags are precomputed once per audit / per criterion by the caller.
+    Returns (possibly_capped_score, list_of_applied_overrides, security_override_applied).
     """
     overrides: List[str] = []
+    security_applied = sec_viol and score > 3
 
     # Rule 1 — security_override
-    if _has_security_violation(opinions) and score > 3:
+    if security_applied:
         overrides.append(
             "SECURITY_OVERRIDE: Confirmed security vulnerability capped score at 3 "
             "(synthesis_rules.security_override)."
@@ -123,18 +129,16 @@ def _apply_overrides(
         score = min(score, 3)
 
     # Rule 2 — fact_supremacy
-    if _has_defense_hallucination(opinions, evidences):
+    if defense_hallucinated:
         overrides.append(
             "FACT_SUPREMACY: Defense claimed theoretical depth but no PDF report "
             "was found by the Detective — Defense overruled for hallucination "
             "(synthesis_rules.fact_supremacy)."
         )
-        for op in opinions:
-            if op.judge == "Defense" and op.score > 3:
-                score = min(score, 3)
-                break
+        if defense_score is not None and defense_score > 3:
+            score = min(score, 3)
 
-    return score, overrides
+    return score, overrides, security_applied
 
 
 # ─────────────────────────────────────────────────────────────
@@ -143,25 +147,31 @@ def _apply_overrides(
 
 def _re_evaluate(
     criterion_id: str,
-    opinions: List[JudicialOpinion],
-    evidences: dict,
-) -> str:
+    jmap: Dict[str, JudicialOpinion],
+    ev_keys: FrozenSet[str],
+) -> List[str]:
     """
     variance_re_evaluation: when variance > 2, re-examine each judge's
     cited evidence for verifiability before accepting the final score.
-    Returns a dissent summary string.
+    jmap maps judge name → that judge's opinion on this criterion;
+    ev_keys is the (hoisted) set of evidence keys present in state.
+    Returns the dissent summary as lines (the caller joins them once).
     """
-    all_keys = set(evidences.keys())
     lines = [
         f"⚠ HIGH-VARIANCE RE-EVALUATION — criterion '{criterion_id}'",
         "",
     ]
-    for judge_label in ["Prosecutor", "Defense", "TechLead"]:
-        op = next((o for o in opinions if o.judge == judge_label), None)
+    verified_count: Dict[str, int] = {}
+    for judge_label in ("Prosecutor", "Defense", "TechLead"):
+        op = jmap.get(judge_label)
         if not op:
             continue
-        verified = [k for k in op.cited_evidence if k in all_keys]
-        unverified = [k for k in op.cited_evidence if k not in all_keys]
+        # Single partition pass; the count feeds the backing comparison below
+        verified: List[str] = []
+        unverified: List[str] = []
+        for k in op.cited_evidence:
+            (verified if k in ev_keys else unverified).append(k)
+        verified_count[judge_label] = len(verified)
 
         lines.append(f"**{judge_label}** (score {op.score}):")
         lines.append(f"  Argument: {op.argument[:180]}…")
@@ -172,10 +182,8 @@ def _re_evaluate(
         lines.append("")
 
     # Determine whose argument has stronger forensic backing
-    p_op = next((o for o in opinions if o.judge == "Prosecutor"), None)
-    d_op = next((o for o in opinions if o.judge == "Defense"), None)
-    p_ver = len([k for k in (p_op.cited_evidence if p_op else []) if k in all_keys])
-    d_ver = len([k for k in (d_op.cited_evidence if d_op else []) if k in all_keys])
+    p_ver = verified_count.get("Prosecutor", 0)
+    d_ver = verified_count.get("Defense", 0)
 
     if p_ver > d_ver:
         lines.append(
@@ -193,113 +201,113 @@ def _re_evaluate(
             "TechLead tiebreaker accepted per Rule of Functionality."
         )
 
-    return "\n".join(lines)
+    return lines
+
+
+# ─────────────────────────────────────────────────────────────
+# GRADE TABLE
+# ─────────────────────────────────────────────────────────────
+
+# (min_pct, status, grade, summary) — checked top-down, first match wins
+_GRADES: Tuple[Tuple[float, str, str, str], ...] = (
+    (80, "PASS", "Master Thinker",
+     "Submission demonstrates deep architectural understanding."),
+    (60, "PASS", "Competent Orchestrator",
+     "Core requirements met with room for improvement."),
+    (40, "BORDERLINE", "Vibe Coder with Potential",
+     "Significant gaps; fundamental patterns present but incomplete."),
+    (float("-inf"), "FAIL", "Vibe Coder",
+     "Critical architectural requirements are missing."),
+)
+
+
+def _grade_for_pct(pct: float) -> Tuple[float, str, str, str]:
+    """Look up the grade band for a percentage score."""
+    return next(g for g in _GRADES if pct >= g[0])
 
 
 # ─────────────────────────────────────────────────────────────
 # MARKDOWN REPORT GENERATOR
 # ─────────────────────────────────────────────────────────────
 
+_JUDGE_ICONS: Dict[str, str] = {"Prosecutor": "⚔", "Defense": "🛡", "TechLead": "🔧"}
+
+
 def generate_markdown_report(report: AuditReport) -> str:
     """
     Serialise AuditReport → structured Markdown.
     Structure: Executive Summary → Criterion Breakdown → Remediation Plan
+    Each fixed section is one templated write into a StringIO buffer.
     """
     now = datetime.now().strftime("%Y-%m-%d %H:%M UTC")
-    lines = []
-    lines.append("# 🏛 Automaton Auditor — Forensic Audit Report")
-    lines.append(f"> Generated: {now}")
-    lines.append(f"> Repository: `{report.repo_url}`")
-    lines.append(" ")
-    lines.append("---")
-    lines.append(" ")
-
-    # Executive Summary
-    lines.append("## Executive Summary")
-    lines.append(" ")
-    lines.append(report.executive_summary)
-    lines.append(" ")
-
     n = len(report.criteria)
-    max_sc = n * 5
     pct = (report.overall_score / 5.0) * 100 if report.overall_score else 0
-    verdict = (
-        "PASS — Master Thinker" if pct >= 80 else
-        "PASS — Competent Orchestrator" if pct >= 60 else
-        "BORDERLINE — Vibe Coder with Potential" if pct >= 40 else
-        "FAIL — Vibe Coder"
-    )
+    _, status, grade, _ = _grade_for_pct(pct)
+    verdict = f"{status} — {grade}"
 
-    lines.append("| Metric | Value |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Overall Score | **{report.overall_score:.1f} / 5.0** |")
-    lines.append(f"| Percentage | {pct:.1f}% |")
-    lines.append(f"| Verdict | **{verdict}** |")
-    lines.append(f"| Criteria Evaluated | {n} / 10 |")
-    lines.append(" ")
-    lines.append("### Score Summary")
-    lines.append(" ")
-    lines.append("| # | Criterion | Score | Override |")
-    lines.append("|---|-----------|-------|---------|")
+    buf = io.StringIO()
+    w = buf.write
+
+    # Executive Summary
+    w(
+        "# 🏛 Automaton Auditor — Forensic Audit Report\n"
+        f"> Generated: {now}\n"
+        f"> Repository: `{report.repo_url}`\n"
+        " \n---\n \n"
+        "## Executive Summary\n \n"
+        f"{report.executive_summary}\n \n"
+        "| Metric | Value |\n"
+        "|--------|-------|\n"
+        f"| Overall Score | **{report.overall_score:.1f} / 5.0** |\n"
+        f"| Percentage | {pct:.1f}% |\n"
+        f"| Verdict | **{verdict}** |\n"
+        f"| Criteria Evaluated | {n} / 10 |\n"
+        " \n"
+        "### Score Summary\n \n"
+        "| # | Criterion | Score | Override |\n"
+        "|---|-----------|-------|---------|\n"
+    )
     for i, cr in enumerate(report.criteria, 1):
         flag = "⚠ OVERRIDE" if cr.overrides_applied else "—"
-        lines.append(f"| {i} | {cr.dimension_name} | **{cr.final_score}/5** | {flag} |")
-    lines.append(" ")
-    lines.append("---")
-    lines.append(" ")
+        w(f"| {i} | {cr.dimension_name} | **{cr.final_score}/5** | {flag} |\n")
+    w(" \n---\n \n")
 
     # Criterion Breakdown
-    lines.append("## Criterion Breakdown")
-    lines.append(" ")
+    w("## Criterion Breakdown\n \n")
     for cr in report.criteria:
-        lines.append(f"### {cr.dimension_name}")
-        lines.append(f"**Final Score: {cr.final_score}/5**")
-        lines.append(" ")
+        w(f"### {cr.dimension_name}\n**Final Score: {cr.final_score}/5**\n \n")
 
-        for ov in cr.overrides_applied:
-            lines.append(f"> 🔴 {ov}")
         if cr.overrides_applied:
-            lines.append(" ")
+            w("".join(f"> 🔴 {ov}\n" for ov in cr.overrides_applied))
+            w(" \n")
 
-        lines.append("#### Judge Opinions")
-        lines.append(" ")
-        icons = {"Prosecutor": "⚔", "Defense": "🛡", "TechLead": "🔧"}
+        w("#### Judge Opinions\n \n")
         for op in cr.judge_opinions:
-            icon = icons.get(op.judge, "⚖")
-            lines.append(f"**{icon} {op.judge}** — Score: {op.score}/5")
-            lines.append(f"> {op.argument}")
+            block = (
+                f"**{_JUDGE_ICONS.get(op.judge, '⚖')} {op.judge}** — Score: {op.score}/5\n"
+                f"> {op.argument}\n"
+            )
             if op.cited_evidence:
-                lines.append(f"> *Cited:* {', '.join(op.cited_evidence)}")
+                block += f"> *Cited:* {', '.join(op.cited_evidence)}\n"
             if op.charges:
-                lines.append(f"> *Charges:* {', '.join(op.charges)}")
-            lines.append(" ")
+                block += f"> *Charges:* {', '.join(op.charges)}\n"
+            w(block + " \n")
 
         if cr.dissent_summary:
-            lines.append("#### ⚖ Dissent Summary")
-            lines.append(" ")
-            lines.append(cr.dissent_summary)
-            lines.append(" ")
-
-        lines.append("#### Remediation")
-        lines.append(" ")
-        lines.append(cr.remediation)
-        lines.append(" ")
-        lines.append("---")
-        lines.append(" ")
+            w(f"#### ⚖ Dissent Summary\n \n{cr.dissent_summary}\n \n")
+
+        w(f"#### Remediation\n \n{cr.remediation}\n \n---\n \n")
 
     # Remediation Plan
-    lines.append("## Remediation Plan")
-    lines.append(" ")
-    lines.append(report.remediation_plan)
-    lines.append(" ")
-    lines.append("---")
-    lines.append(" ")
-    lines.append(
+    w(
+        "## Remediation Plan\n \n"
+        f"{report.remediation_plan}\n \n"
+        "---\n \n"
         "_This report was generated by the Automaton Auditor —  "
         "a hierarchical LangGraph swarm implementing the Digital Courtroom architecture._"
     )
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -336,23 +344,33 @@ def chief_justice_node(state: AgentState) -> dict:
         )
         return {"final_report": fallback, "errors": ["ChiefJustice: no opinions"]}
 
-    # Group opinions by criterion
+    # Group opinions by criterion; flag Prosecutor security charges in the same pass
     by_criterion: Dict[str, List[JudicialOpinion]] = defaultdict(list)
+    sec_viol: Set[str] = set()
     for op in opinions:
         by_criterion[op.criterion_id].append(op)
+        if _has_security_violation(op):
+            sec_viol.add(op.criterion_id)
+    defense_hallucinated = _has_defense_hallucination(evidences.get("theoretical_depth", []))
+    ev_keys = frozenset(evidences)
 
-    dim_lookup = {d["id"]: d for d in dimensions}
+    dim_names = {d["id"]: d.get("name", d["id"]) for d in dimensions}
     results: List[CriterionResult] = []
-    all_remediations: List[str] = []
+    # Remediation plan streamed straight into its final buffer
+    rem_buf = io.StringIO()
+    rem_buf.write("The following file-level fixes are ordered by impact:\n\n")
+    rem_sep = ""
     total_score = 0.0
+    security_count = 0
 
     for criterion_id, crit_opinions in by_criterion.items():
-        dim = dim_lookup.get(criterion_id, {})
-        dim_name = dim.get("name", criterion_id)
+        dim_name = dim_names.get(criterion_id, criterion_id)
 
-        p_op = next((o for o in crit_opinions if o.judge == "Prosecutor"), None)
-        d_op = next((o for o in crit_opinions if o.judge == "Defense"), None)
-        t_op = next((o for o in crit_opinions if o.judge == "TechLead"), None)
+        # Bucket by judge once; first opinion per judge wins, as before
+        jmap: Dict[str, JudicialOpinion] = {}
+        for o in crit_opinions:
+            jmap.setdefault(o.judge, o)
+        p_op, d_op, t_op = jmap.get("Prosecutor"), jmap.get("Defense"), jmap.get("TechLead")
 
         p = p_op.score if p_op else 3
         d = d_op.score if d_op else 3
@@ -360,41 +378,55 @@ def chief_justice_node(state: AgentState) -> dict:
 
         logger.info("  [%s] P=%d D=%d T=%d", criterion_id, p, d, t)
 
-        # Step 1 — resolve scores (deterministic rules)
-        final_score, resolution, needs_re_eval = _resolve_scores(p, d, t, criterion_id)
-
-        # Step 2 — variance_re_evaluation (rule 5)
-        dissent: Optional[str] = None
-        if needs_re_eval:
-            logger.info("  [%s] HIGH VARIANCE — triggering re-evaluation", criterion_id)
-            dissent = _re_evaluate(criterion_id, crit_opinions, evidences)
-
-        # Step 3 — override rules (rules 1 + 2)
-        final_score, overrides = _apply_overrides(
-            final_score, criterion_id, crit_opinions, evidences
-        )
-
-        # Step 4 — dissent_requirement (rule 4)
-        variance = max(p, d, t) - min(p, d, t)
-        if variance > 2 and not dissent:
-            dissent = (
-                f"Dissent: Prosecutor={p}, Defense={d}, TechLead={t}.  "
-                f"Resolution: {resolution}."
+        overrides: List[str]
+        dissent: Optional[str]
+        if p == d == t and criterion_id not in sec_viol and not defense_hallucinated:
+            # Unanimous and no override rule can fire: consensus is the score
+            final_score, overrides, dissent = p, [], None
+            security_applied = False
+        else:
+            # Step 1 — resolve scores (deterministic rules)
+            final_score, resolution, needs_re_eval, variance = _resolve_scores(p, d, t, criterion_id)
+
+            # Step 2 — variance_re_evaluation (rule 5)
+            # Dissent is collected as lines and joined once at the end
+            dissent_parts: List[str] = []
+            if needs_re_eval:
+                logger.info("  [%s] HIGH VARIANCE — triggering re-evaluation", criterion_id)
+                dissent_parts = _re_evaluate(criterion_id, jmap, ev_keys)
+
+            # Step 3 — override rules (rules 1 + 2)
+            final_score, overrides, security_applied = _apply_overrides(
+                final_score,
+                criterion_id in sec_viol,
+                defense_hallucinated,
+                d_op.score if d_op else None,
             )
-        if overrides:
-            dissent = (dissent or "") + "\n" + "\n".join(overrides)
+
+            # Step 4 — dissent_requirement (rule 4)
+            if variance > 2 and not dissent_parts:
+                dissent_parts.append(
+                    f"Dissent: Prosecutor={p}, Defense={d}, TechLead={t}.  "
+                    f"Resolution: {resolution}."
+                )
+            dissent_parts.extend(overrides)
+            dissent = "\n".join(dissent_parts) or None
 
         # Step 5 — build remediation
-        parts = []
-        if t_op:
-            parts.append(f"**Tech Lead:** {t_op.argument}")
-        if p_op and p_op.charges:
-            for c in p_op.charges:
-                parts.append(f"- Fix required: {c}")
-        remediation = "\n".join(parts) or f"No specific remediation required for {dim_name}."
-        all_remediations.append(f"### {dim_name}\n{remediation}")
-
-        result = CriterionResult(
+        charges = p_op.charges if p_op else ()
+        if charges:
+            fixes = "\n".join(f"- Fix required: {c}" for c in charges)
+            remediation = f"**Tech Lead:** {t_op.argument}\n{fixes}" if t_op else fixes
+        elif t_op:
+            remediation = f"**Tech Lead:** {t_op.argument}"
+        else:
+            remediation = f"No specific remediation required for {dim_name}."
+        rem_buf.write(f"{rem_sep}### {dim_name}\n{remediation}")
+        rem_sep = "\n\n"
+
+        # All inputs are already validated (opinions) or derived in-range
+        # (scores 1–5), so skip re-running the validator pipeline.
+        result = CriterionResult.model_construct(
             dimension_id=criterion_id,
             dimension_name=dim_name,
             final_score=final_score,
@@ -405,6 +437,7 @@ def chief_justice_node(state: AgentState) -> dict:
         )
         results.append(result)
         total_score += final_score
+        security_count += security_applied
         logger.info(
             "  [%s] Final=%d%s",
             criterion_id, final_score,
@@ -415,19 +448,7 @@ def chief_justice_node(state: AgentState) -> dict:
     overall = total_score / n if n > 0 else 0.0
     pct = (overall / 5.0) * 100
 
-    grade, summary_line = (
-        ("Master Thinker", "Submission demonstrates deep architectural understanding.")
-        if pct >= 80 else
-        ("Competent Orchestrator", "Core requirements met with room for improvement.")
-        if pct >= 60 else
-        ("Vibe Coder with Potential", "Significant gaps; fundamental patterns present but incomplete.")
-        if pct >= 40 else
-        ("Vibe Coder", "Critical architectural requirements are missing.")
-    )
-
-    security_count = sum(
-        1 for cr in results if any("SECURITY" in o for o in cr.overrides_applied)
-    )
+    _, _, grade, summary_line = _grade_for_pct(pct)
 
     exec_summary = (
         f"**Verdict: {grade}**\n\n"
@@ -441,15 +462,12 @@ def chief_justice_node(state: AgentState) -> dict:
         f"to produce this final verdict."
     )
 
-    audit_report = AuditReport(
+    audit_report = AuditReport.model_construct(
         repo_url=repo_url,
         executive_summary=exec_summary,
         overall_score=overall,
         criteria=results,
-        remediation_plan=(
-            "The following file-level fixes are ordered by impact:\n\n"
-            + "\n\n".join(all_remediations)
-        ),
+        remediation_plan=rem_buf.getvalue(),
     )
 
     logger.info(
@@ -15,7 +15,7 @@ Design principles:
 • TypedDict is used for AgentState because LangGraph requires it
 """
 import operator
-from typing import Annotated, Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, FrozenSet, List, Literal, Optional
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
 
@@ -89,6 +89,13 @@ class JudicialOpinion(BaseModel):
     )
 
 
+class JudicialBench(BaseModel):
+    """One judge's verdicts on every criterion, returned from a single batched call."""
+    opinions: List[JudicialOpinion] = Field(
+        description="Exactly one JudicialOpinion per criterion in the brief"
+    )
+
+
 # ─────────────────────────────────────────────────────────────
 # SUPREME COURT — Verdict and Report objects
 # ─────────────────────────────────────────────────────────────
@@ -139,6 +146,10 @@ class AgentState(TypedDict):
       opinions:  operator.add  → list-append so all three judges accumulate
                                   without overwriting each other
       errors:    operator.add  → accumulates errors from any node
+      failed_nodes: operator.add → names of detectives that errored, so
+                                  routing is a membership test, not a scan
+      completed_detectives: operator.add → names of detectives that wrote
+                                  evidence, so routing needs no key scan
     """
     # ── Inputs ────────────────────────────────────────────────
     repo_url: str
@@ -146,6 +157,7 @@ class AgentState(TypedDict):
     audit_type: str          # "self" | "peer" | "received"
     rubric_dimensions: List[Dict]   # loaded from week2_rubric.json
     synthesis_rules: Dict[str, Any]
+    expected_dim_ids: FrozenSet[str]  # rubric dimension IDs, for coverage checks
 
     # ── Detective outputs (parallel-safe via reducers) ─────────
     evidences: Annotated[Dict[str, List[Evidence]], operator.ior]
@@ -162,4 +174,6 @@ class AgentState(TypedDict):
     final_report: Optional[AuditReport]
 
     # ── Error tracking (accumulated across all nodes) ──────────
-    errors: Annotated[List[str], operator.add]
\ No newline at end of file
+    errors: Annotated[List[str], operator.add]
+    failed_nodes: Annotated[List[str], operator.add]
+    completed_detectives: Annotated[List[str], operator.add]
\ No newline at end of file
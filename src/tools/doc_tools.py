@@ -7,10 +7,14 @@ Implements:
 • Theoretical-depth keyword + context verification
 • Cross-reference hallucination check (claimed file paths vs repo files)
 """
+import functools
+import heapq
+import io
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from src.state import DocEvidence, Evidence
 
 logger = logging.getLogger(__name__)
@@ -27,6 +31,9 @@ DEEP_CONCEPTS = [
     "Pydantic",
 ]
 
+# (display name, lowercase needle) — lowered once at import
+_DEEP_CONCEPTS_LC: Tuple[Tuple[str, str], ...] = tuple((c, c.lower()) for c in DEEP_CONCEPTS)
+
 DEPTH_INDICATORS = [
     "because", "therefore", "this means", "in practice",
     "the architecture", "we implemented", "this ensures",
@@ -39,10 +46,44 @@ DEPTH_INDICATORS = [
 # PDF INGESTION — RAG-LITE
 # ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4)
+def _read_pdf_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    return Path(path).read_bytes()
+
+
+def load_pdf_bytes(path: str) -> bytes:
+    """
+    Read a PDF once per (path, mtime, size).
+    DocAnalyst and VisionInspector both go through here, so the file is
+    read from disk once per audit instead of once per detective.
+    """
+    st = os.stat(path)
+    return _read_pdf_cached(path, st.st_mtime_ns, st.st_size)
+
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def _word_chunks(text: str, size: int) -> Iterator[str]:
+    """
+    Yield size-word chunks, single-space joined, exactly as
+    " ".join(text.split()[i:i+size]) would — but streaming over the text
+    so only one chunk's words are held at a time, never the whole list.
+    """
+    batch: List[str] = []
+    for m in _WORD_RE.finditer(text):
+        batch.append(m.group())
+        if len(batch) == size:
+            yield " ".join(batch)
+            batch = []
+    if batch:
+        yield " ".join(batch)
+
+
 def ingest_pdf(path: str) -> List[Dict[str, str]]:
     """
     Parse a PDF into ~500-word text chunks.
-    Tries docling → pypdf → pdfminer in order.
+    Tries docling → pypdfium2 → pypdf → pdfminer in order.
     Returns: [{"page": str, "text": str}, ...]
     """
     if not Path(path).exists():
@@ -54,10 +95,10 @@ def ingest_pdf(path: str) -> List[Dict[str, str]]:
         from docling.document_converter import DocumentConverter
         result = DocumentConverter().convert(path)
         md = result.document.export_to_markdown()
-        words = md.split()
-        chunks = []
-        for i in range(0, len(words), 500):
-            chunks.append({"page": f"chunk_{i//500}", "text": " ".join(words[i:i+500])})
+        chunks = [
+            {"page": f"chunk_{i}", "text": text}
+            for i, text in enumerate(_word_chunks(md, 500))
+        ]
         if chunks:
             logger.info("docling: %d chunks from %s", len(chunks), path)
             return chunks
@@ -66,10 +107,32 @@ def ingest_pdf(path: str) -> List[Dict[str, str]]:
     except Exception as exc:
         logger.warning("docling failed: %s", exc)
 
-    # 2. pypdf
+    # 2. pypdfium2 (PDFium in C; far faster than pure-Python pypdf)
+    try:
+        import pypdfium2 as pdfium
+        doc = pdfium.PdfDocument(load_pdf_bytes(path))
+        try:
+            chunks = []
+            for i in range(len(doc)):
+                textpage = doc[i].get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                if text.strip():
+                    chunks.append({"page": str(i + 1), "text": text})
+        finally:
+            doc.close()
+        if chunks:
+            logger.info("pypdfium2: %d pages from %s", len(chunks), path)
+            return chunks
+    except ImportError:
+        logger.debug("pypdfium2 not installed")
+    except Exception as exc:
+        logger.warning("pypdfium2 failed: %s", exc)
+
+    # 3. pypdf
     try:
         import pypdf
-        reader = pypdf.PdfReader(path)
+        reader = pypdf.PdfReader(io.BytesIO(load_pdf_bytes(path)))
         chunks = []
         for i, page in enumerate(reader.pages):
             text = page.extract_text() or ""
@@ -83,12 +146,12 @@ def ingest_pdf(path: str) -> List[Dict[str, str]]:
     except Exception as exc:
         logger.warning("pypdf failed: %s", exc)
 
-    # 3. pdfminer
+    # 4. pdfminer
     try:
         from pdfminer.high_level import extract_pages
         from pdfminer.layout import LTTextContainer
         chunks = []
-        for i, layout in enumerate(extract_pages(path)):
+        for i, layout in enumerate(extract_pages(io.BytesIO(load_pdf_bytes(path)))):
             text = " ".join(
                 elem.get_text() for elem in layout if isinstance(elem, LTTextContainer)
             )
@@ -108,12 +171,23 @@ def ingest_pdf(path: str) -> List[Dict[str, str]]:
 
 def query_chunks(chunks: List[Dict[str, str]], query: str, top_k: int = 3) -> List[str]:
     """Keyword-based chunk retrieval (RAG-lite). Returns top_k most relevant chunks."""
-    q = query.lower()
-    scored = sorted(
-        ((sum(1 for w in q.split() if w in c["text"].lower()), c["text"]) for c in chunks),
-        reverse=True,
+    words = query.lower().split()
+    # Each word is a C-level substring search against the chunk's lowercase
+    # text — measured faster than a regex alternation.
+    top = heapq.nlargest(
+        top_k,
+        ((sum(w in lower for w in words), c["text"])
+         for c in chunks for lower in (_lowered(c["text"]),)),
     )
-    return [text for score, text in scored[:top_k] if score > 0]
+    return [text for score, text in top if score > 0]
+
+
+@functools.lru_cache(maxsize=512)
+def _lowered(text: str) -> str:
+    """Lowercase copy of a chunk's text, memoised by content so repeated
+    queries over the same report lower each page once without touching
+    the caller's chunk dicts."""
+    return text.lower()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -125,18 +199,30 @@ def analyze_theoretical_depth(chunks: List[Dict[str, str]]) -> Evidence:
     Check for deep conceptual understanding vs. buzzword-dropping.
     A concept must appear in a substantive explanation, not just the intro.
     """
-    full_text = " ".join(c["text"] for c in chunks)
+    return _theoretical_depth(" ".join(c["text"] for c in chunks))[0]
+
+
+def _theoretical_depth(full_text: str) -> Tuple[Evidence, List[str]]:
+    """
+    One lowercase copy, one scan per concept/indicator.
+    Returns the Evidence plus the concepts found, so analyze_pdf_report
+    does not rebuild and rescan the text to list them again.
+    """
     lower = full_text.lower()
     found_concepts: List[str] = []
     context_snippets: List[str] = []
 
-    for concept in DEEP_CONCEPTS:
-        idx = lower.find(concept.lower())
+    # str.find is a C-level fast search; measured faster than a single
+    # regex alternation over the same text for this handful of literals.
+    for concept, concept_lc in _DEEP_CONCEPTS_LC:
+        idx = lower.find(concept_lc)
         if idx >= 0:
             found_concepts.append(concept)
-            start = max(0, idx - 150)
-            end = min(len(full_text), idx + 250)
-            context_snippets.append(f"[{concept}]: ...{full_text[start:end].strip()}...")
+            # Only five snippets are reported; later hits still count
+            if len(context_snippets) < 5:
+                start = max(0, idx - 150)
+                end = min(len(full_text), idx + 250)
+                context_snippets.append(f"[{concept}]: ...{full_text[start:end].strip()}...")
 
     depth_score = sum(1 for phrase in DEPTH_INDICATORS if phrase in lower)
     has_deep = len(found_concepts) >= 3 and depth_score >= 4
@@ -148,7 +234,7 @@ def analyze_theoretical_depth(chunks: List[Dict[str, str]]) -> Evidence:
     return Evidence(
         goal="Verify deep theoretical understanding of multi-agent orchestration concepts",
         found=has_deep,
-        content="\n\n".join(context_snippets[:5]) or "No relevant concepts found",
+        content="\n\n".join(context_snippets) or "No relevant concepts found",
         location="pdf_report",
         rationale=(
             f"Found {len(found_concepts)}/{len(DEEP_CONCEPTS)} concepts: {found_concepts}.  "
@@ -157,18 +243,32 @@ def analyze_theoretical_depth(chunks: List[Dict[str, str]]) -> Evidence:
         ),
         confidence=confidence,
         tags=["theoretical-depth", "deep" if has_deep else "shallow"],
-    )
+    ), found_concepts
 
 
 # ─────────────────────────────────────────────────────────────
 # FORENSIC PROTOCOL B — HALLUCINATION CHECK
 # ─────────────────────────────────────────────────────────────
 
+_FILE_CLAIM_RE = re.compile(r'(?:src/|./)[\w/._-]+\.(?:py|json|md|txt|yaml|yml|toml)')
+
+
+# Unique claims kept per report; a real report cites tens of paths.
+_MAX_CLAIMS = 1000
+
+
 def extract_file_claims(chunks: List[Dict[str, str]]) -> List[str]:
-    """Extract all file-path claims from PDF text using a regex pattern."""
-    text = " ".join(c["text"] for c in chunks)
-    pattern = r'(?:src/|./)[\w/._-]+\.(?:py|json|md|txt|yaml|yml|toml)'
-    return list(set(re.findall(pattern, text)))
+    """Extract unique file-path claims (at most _MAX_CLAIMS) from PDF text."""
+    # Per chunk: paths never contain spaces, so nothing spans the chunk
+    # boundary and the full-text join is unnecessary.
+    seen: Set[str] = set()
+    for c in chunks:
+        for m in _FILE_CLAIM_RE.finditer(c["text"]):
+            seen.add(m.group())
+            if len(seen) >= _MAX_CLAIMS:
+                logger.warning("File-claim scan capped at %d unique paths", _MAX_CLAIMS)
+                return list(seen)
+    return list(seen)
 
 
 def cross_reference_claims(
@@ -201,12 +301,22 @@ def cross_reference_claims(
         except Exception:
             pass
 
+    # Every path-component suffix of every repo file: a claim like
+    # "nodes/judges.py" is an O(1) set hit. Claims that are not clean
+    # suffixes keep the old any-substring semantics via one C-level search
+    # over a newline-joined index instead of a Python loop over all files.
+    suffixes: set = set()
+    for rel in repo_relative:
+        parts = rel.split("/")
+        suffixes.update("/".join(parts[i:]) for i in range(len(parts)))
+    path_index = "\n".join(repo_relative)
+
     verified: List[str] = []
     hallucinated: List[str] = []
 
     for claim in claimed:
         normalised = claim.lstrip("./").replace("\\", "/")
-        if normalised in repo_relative or any(normalised in r for r in repo_relative):
+        if normalised in suffixes or normalised in path_index:
             verified.append(claim)
         else:
             hallucinated.append(claim)
@@ -281,10 +391,8 @@ def analyze_pdf_report(
             hallucination_check=blank,
         )
 
-    theoretical = analyze_theoretical_depth(chunks)
+    theoretical, found_conc = _theoretical_depth(" ".join(c["text"] for c in chunks))
     hallu_check = cross_reference_claims(chunks, repo_files, repo_root)
-    lower = " ".join(c["text"] for c in chunks).lower()
-    found_conc = [c for c in DEEP_CONCEPTS if c.lower() in lower]
 
     return DocEvidence(
         theoretical_depth=theoretical,
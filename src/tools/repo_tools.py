@@ -9,17 +9,18 @@ Key design principles:
 • Returns structured Evidence objects, never raw strings
 """
 import ast
+import functools
 import logging
 import os
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from src.state import Evidence
 
 logger = logging.getLogger(__name__)
 
-SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules", ".mypy_cache", ".tox"}
+SKIP_DIRS = frozenset({".git", "__pycache__", ".venv", "venv", "node_modules", ".mypy_cache", ".tox"})
 
 
 # ─────────────────────────────────────────────────────────────
@@ -36,6 +37,7 @@ def clone_repo_sandboxed(
     Safety contract:
       • Never uses os.system — all subprocess calls capture stdout/stderr
       • Clone target is always tmpdir.name, never CWD
+      • Shallow, single-branch, blobless: history metadata + HEAD tree only
       • Caller MUST call tmpdir.cleanup() to free disk space
       • On any failure, cleanup is performed here and (None, None) is returned
 
@@ -45,7 +47,13 @@ def clone_repo_sandboxed(
     tmpdir = tempfile.TemporaryDirectory(prefix="auditor_clone_")
     try:
         result = subprocess.run(
-            ["git", "clone", "--depth", str(depth), repo_url, tmpdir.name],
+            [
+                "git", "clone",
+                "--depth", str(depth),
+                "--filter=blob:none",   # blobs fetched only for the checked-out tree
+                "--single-branch",
+                repo_url, tmpdir.name,
+            ],
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -74,23 +82,28 @@ def extract_git_history(repo_path: str) -> Evidence:
     Runs git log --oneline --reverse and classifies as atomic vs monolithic.
     """
     try:
+        # NUL-delimited fields and records: subjects may contain any
+        # printable character, so no in-band separator is safe.
         result = subprocess.run(
-            ["git", "log", "--oneline", "--reverse", "--format=%H|%ai|%s"],
+            ["git", "log", "--reverse", "-z", "--format=%H%x00%ai%x00%s"],
             cwd=repo_path,
             capture_output=True,
-            text=True,
             timeout=30,
         )
         if result.returncode != 0:
             return _error_evidence("Verify atomic git commit history", repo_path,
-                                   "git log returned non-zero", result.stderr)
-
-        lines = [l.strip() for l in result.stdout.strip().splitlines() if l.strip()]
-        commits = []
-        for line in lines:
-            parts = line.split("|", 2)
-            if len(parts) == 3:
-                commits.append({"hash": parts[0], "timestamp": parts[1], "message": parts[2]})
+                                   "git log returned non-zero",
+                                   result.stderr.decode("utf-8", errors="replace"))
+
+        fields = result.stdout.split(b"\0")
+        commits = [
+            {
+                "hash": fields[i].decode("ascii"),
+                "timestamp": fields[i + 1].decode("ascii"),
+                "message": fields[i + 2].decode("utf-8", errors="replace").strip(),
+            }
+            for i in range(0, len(fields) - 2, 3)
+        ]
 
         n = len(commits)
         messages = [c["message"].lower() for c in commits]
@@ -151,11 +164,16 @@ class ASTVisitor(ast.NodeVisitor):
 
     def visit_Call(self, node: ast.Call):
         try:
-            self.function_calls.append(ast.unparse(node.func))
+            self.function_calls.append(_dotted(node.func) or ast.unparse(node.func))
         except Exception:
             pass
         self.generic_visit(node)
 
+    def visit_Constant(self, node: ast.Constant):
+        # Leaf node. Overriding skips NodeVisitor's deprecated Num/Str/Bytes
+        # dispatch shim, which otherwise runs for every literal in the file.
+        pass
+
     def visit_Import(self, node: ast.Import):
         for alias in node.names:
             self.imports.append(alias.name)
@@ -173,8 +191,38 @@ class ASTVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+def _dotted(node: ast.expr) -> Optional[str]:
+    """
+    "a.b.c" for a plain Name/Attribute chain — the same string ast.unparse
+    returns, without the general unparser. None for anything else.
+    """
+    parts: List[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
 def parse_python_file(filepath: str) -> Optional[ASTVisitor]:
-    """Parse one .py file and return a populated ASTVisitor, or None on error."""
+    """
+    Parse one .py file and return a populated ASTVisitor, or None on error.
+    Results are memoised per process on (path, mtime_ns, size), so protocols
+    that revisit the same file share one parse; an edited file re-parses.
+    The returned visitor is shared — treat it as read-only.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError as exc:
+        logger.debug("Error parsing %s: %s", filepath, exc)
+        return None
+    return _parse_cached(os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(filepath: str, mtime_ns: int, size: int) -> Optional[ASTVisitor]:
     try:
         src = Path(filepath).read_text(encoding="utf-8", errors="replace")
         tree = ast.parse(src, filename=filepath)
@@ -189,17 +237,92 @@ def parse_python_file(filepath: str) -> Optional[ASTVisitor]:
         return None
 
 
-def scan_directory_for_python(root: str) -> List[str]:
-    """Recursively find all .py files, excluding virtualenvs and cache dirs."""
+def scan_directory_for_python(root: str, limit: Optional[int] = None) -> List[str]:
+    """
+    Recursively find all .py files, excluding virtualenvs and cache dirs.
+    With limit set, the walk stops as soon as that many files are found.
+    """
     py_files: List[str] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-        for fname in filenames:
-            if fname.endswith(".py"):
-                py_files.append(os.path.join(dirpath, fname))
+    for path in _iter_python(root):
+        py_files.append(path)
+        if limit is not None and len(py_files) >= limit:
+            break
     return py_files
 
 
+def _iter_python(root: str) -> Iterator[str]:
+    """
+    os.scandir walk in os.walk's top-down order (a directory's files, then
+    its subdirectories), without os.walk's per-directory name lists.
+    Symlinked directories are not followed; unreadable ones are skipped.
+    """
+    stack = [root]
+    while stack:
+        subdirs: List[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+class _RepoIndex:
+    """
+    One walk of a repo, shared by the four AST protocols. The file list is
+    scanned once and each file is parsed / read at most once, on demand.
+    """
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self._files: Optional[List[str]] = None
+        self._data: Dict[str, bytes] = {}
+
+    @property
+    def files(self) -> List[str]:
+        if self._files is None:
+            self._files = scan_directory_for_python(self.repo_path)
+        return self._files
+
+    def under(self, subdir: str) -> List[str]:
+        """Files inside subdir, in walk order (same as scanning subdir itself)."""
+        if subdir == self.repo_path:
+            return self.files
+        prefix = subdir.rstrip(os.sep) + os.sep
+        return [f for f in self.files if f.startswith(prefix)]
+
+    def parse(self, fpath: str) -> Optional[ASTVisitor]:
+        return parse_python_file(fpath)
+
+    def data(self, fpath: str) -> bytes:
+        """
+        Raw file bytes for literal marker checks. The markers are ASCII, so
+        searching the undecoded bytes gives the same answer as decoding first.
+        """
+        raw = self._data.get(fpath)
+        if raw is None:
+            raw = self._data[fpath] = Path(fpath).read_bytes()
+        return raw
+
+
+def analyze_repo_all(repo_path: str) -> Dict[str, Evidence]:
+    """
+    Run protocols B–E over a single directory walk and return their Evidence
+    keyed by rubric dimension id.
+    """
+    idx = _RepoIndex(repo_path)
+    return {
+        "state_management_rigor": _state_from(idx),
+        "graph_orchestration": _graph_from(idx),
+        "safe_tool_engineering": _sandbox_from(idx),
+        "structured_output_enforcement": _structured_from(idx),
+    }
+
+
 # ─────────────────────────────────────────────────────────────
 # FORENSIC PROTOCOL A — STATE MANAGEMENT
 # ─────────────────────────────────────────────────────────────
@@ -209,6 +332,11 @@ def analyze_state_management(repo_path: str) -> Evidence:
     Check for typed state: Pydantic BaseModel + TypedDict with operator reducers.
     Looks in src/state.py, src/graph.py, state.py (in that priority order).
     """
+    return _state_from(_RepoIndex(repo_path))
+
+
+def _state_from(idx: _RepoIndex) -> Evidence:
+    repo_path = idx.repo_path
     candidates = [
         os.path.join(repo_path, "src", "state.py"),
         os.path.join(repo_path, "src", "graph.py"),
@@ -223,7 +351,7 @@ def analyze_state_management(repo_path: str) -> Evidence:
     for fpath in candidates:
         if not os.path.exists(fpath):
             continue
-        v = parse_python_file(fpath)
+        v = idx.parse(fpath)
         if not v:
             continue
         location = fpath
@@ -239,13 +367,16 @@ def analyze_state_management(repo_path: str) -> Evidence:
             snippet += f"TypedDict classes: {[c['name'] for c in typeddict_classes]}\n"
 
         # Check for operator reducers in imports + assignments
-        has_operator_import = any("operator" in imp for imp in v.imports)
-        has_reducer_assign = any(
-            "operator.add" in a or "operator.ior" in a for a in v.assignments
-        )
-        if has_operator_import or has_reducer_assign:
+        if not found_reducers and (
+            any("operator" in imp for imp in v.imports)
+            or any("operator.add" in a or "operator.ior" in a for a in v.assignments)
+        ):
             found_reducers = True
 
+        # Every signal is in: the remaining candidates cannot change the verdict
+        if found_pydantic and found_typed_dict and found_reducers:
+            break
+
     found = found_pydantic and found_typed_dict
     confidence = 0.92 if (found and found_reducers) else (0.60 if found else 0.15)
 
@@ -272,9 +403,14 @@ def analyze_graph_structure(repo_path: str) -> Evidence:
     Detect LangGraph StateGraph with parallel fan-out/fan-in.
     Uses add_edge call counts and node name analysis.
     """
+    return _graph_from(_RepoIndex(repo_path))
+
+
+def _graph_from(idx: _RepoIndex) -> Evidence:
+    repo_path = idx.repo_path
     graph_files: List[Tuple[str, ASTVisitor]] = []
-    for fpath in scan_directory_for_python(repo_path):
-        v = parse_python_file(fpath)
+    for fpath in idx.files:
+        v = idx.parse(fpath)
         if not v:
             continue
         if any("langgraph" in imp or "StateGraph" in imp for imp in v.imports):
@@ -348,6 +484,11 @@ def analyze_tool_sandboxing(repo_path: str) -> Evidence:
     """
     Verify git clone uses tempfile + subprocess, not raw os.system.
     """
+    return _sandbox_from(_RepoIndex(repo_path))
+
+
+def _sandbox_from(idx: _RepoIndex) -> Evidence:
+    repo_path = idx.repo_path
     tools_dir = os.path.join(repo_path, "src", "tools")
     if not os.path.exists(tools_dir):
         tools_dir = repo_path
@@ -358,8 +499,8 @@ def analyze_tool_sandboxing(repo_path: str) -> Evidence:
     snippet = ""
     location = tools_dir
 
-    for fpath in scan_directory_for_python(tools_dir):
-        v = parse_python_file(fpath)
+    for fpath in idx.under(tools_dir):
+        v = idx.parse(fpath)
         if not v:
             continue
 
@@ -377,12 +518,12 @@ def analyze_tool_sandboxing(repo_path: str) -> Evidence:
             uses_subprocess = True
 
         try:
-            raw = Path(fpath).read_text(errors="replace")
-            if "TemporaryDirectory" in raw:
+            raw = idx.data(fpath)
+            if b"TemporaryDirectory" in raw:
                 uses_tempfile = True
                 snippet = "TemporaryDirectory confirmed"
                 location = fpath
-            if "try:" in raw and "except" in raw:
+            if b"try:" in raw and b"except" in raw:
                 has_error_handling = True
         except Exception:
             pass
@@ -423,6 +564,11 @@ def analyze_structured_output(repo_path: str) -> Evidence:
     Confirm Judge LLMs use .with_structured_output() or .bind_tools()
     bound to the JudicialOpinion Pydantic schema.
     """
+    return _structured_from(_RepoIndex(repo_path))
+
+
+def _structured_from(idx: _RepoIndex) -> Evidence:
+    repo_path = idx.repo_path
     candidates = [
         os.path.join(repo_path, "src", "nodes", "judges.py"),
         os.path.join(repo_path, "src", "judges.py"),
@@ -438,25 +584,25 @@ def analyze_structured_output(repo_path: str) -> Evidence:
         if not os.path.exists(fpath):
             continue
         location = fpath
-        raw = Path(fpath).read_text(errors="replace")
+        raw = idx.data(fpath)
 
-        if "with_structured_output" in raw:
+        if b"with_structured_output" in raw:
             found_structured = True
             snippet += "with_structured_output() found\n"
-        if "bind_tools" in raw:
+        if b"bind_tools" in raw:
             found_structured = True
             snippet += "bind_tools() found\n"
-        if "JudicialOpinion" in raw or "BaseModel" in raw:
+        if b"JudicialOpinion" in raw or b"BaseModel" in raw:
             found_pydantic_binding = True
-        if "retry" in raw.lower() or ("for attempt" in raw and "range" in raw):
+        if b"retry" in raw.lower() or (b"for attempt" in raw and b"range" in raw):
             found_retry = True
         break  # Use the first matching file
 
     # Fallback: scan whole repo
     if not found_structured:
-        for fpath in scan_directory_for_python(repo_path):
-            raw = Path(fpath).read_text(errors="replace")
-            if "with_structured_output" in raw or "bind_tools" in raw:
+        for fpath in idx.files:
+            raw = idx.data(fpath)
+            if b"with_structured_output" in raw or b"bind_tools" in raw:
                 found_structured = True
                 location = fpath
                 snippet = f"Found in {os.path.relpath(fpath, repo_path)}"
@@ -3,88 +3,533 @@ src/tools/vision_tools.py
 ─────────────────────────
 Forensic tools for the VisionInspector (Diagram Detective).
 Implements:
-• Image extraction from PDF reports
+• Streaming image extraction from PDF reports
 • Multimodal LLM analysis of architectural diagrams
 • Classification of diagram type (LangGraph StateGraph vs generic flowchart)
 """
+import asyncio
+import base64
+import functools
+import hashlib
+import importlib.util
+import io
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional
+import multiprocessing
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+from pydantic import ValidationError
+from src import judge_cache
+from src._aio import run_sync
+from src._env import env_int, load_once
 from src.state import Evidence, VisionEvidence
+from src.tools.doc_tools import load_pdf_bytes
 
 logger = logging.getLogger(__name__)
 
+# Embedded images smaller than this on either side are icons, not diagrams
+_MIN_IMAGE_PX = 64
 
-def extract_images_from_pdf(pdf_path: str) -> List[Path]:
+# Page text that marks a page worth rendering when it has no embedded image
+_DIAGRAM_HINTS = ("graph", "flow", "node", "edge", "state")
+
+# Below this page count one process is faster than spawning a pool
+_PARALLEL_MIN_PAGES = 32
+_MAX_EXTRACT_WORKERS = 4
+# Pages per worker task; small chunks keep the in-flight image bytes bounded
+_PARALLEL_CHUNK_PAGES = 4
+
+# Image XObjects are streams, which PDF never packs into object streams, so
+# their dictionaries always appear uncompressed in the file bytes
+_IMAGE_XOBJECT_RE = re.compile(rb"/Subtype\s*/Image")
+
+
+@dataclass(frozen=True, slots=True)
+class PdfImage:
+    """One embedded image, in the encoding it is stored with in the PDF."""
+    page: int
+    ext: str
+    data: bytes
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedImage:
+    """A downsampled image ready to send: its data URL and content digest."""
+    page: int
+    url: str
+    sha256: str
+
+
+@contextmanager
+def open_pdf(pdf_path: str) -> Iterator[Optional[Any]]:
     """
-    Extract all images from a PDF file.
-    Returns list of temporary image file paths.
-    Note: This is a simplified implementation - production would use pdf2image or similar.
+    Open a PDF once with PyMuPDF for every vision step that needs it.
+    Yields None when PyMuPDF is missing or the file cannot be parsed;
+    the document is always closed on exit.
     """
-    images: List[Path] = []
     try:
-        # Try pypdf first
-        import pypdf
-        reader = pypdf.PdfReader(pdf_path)
-        for page_num, page in enumerate(reader.pages):
-            if "/Images" in page["/Resources"]:
-                logger.info("Images found on page %d", page_num + 1)
-                # In production, extract actual images here
-                # For now, return empty list (graceful degradation)
-        return images
+        import fitz  # PyMuPDF
     except ImportError:
-        logger.debug("pypdf not installed for image extraction")
+        logger.debug("PyMuPDF not installed for image extraction — pip install pymupdf")
+        yield None
+        return
+
+    try:
+        doc = fitz.open(stream=load_pdf_bytes(pdf_path), filetype="pdf")
+    except Exception as exc:
+        logger.warning("Could not open %s for diagram extraction: %s", pdf_path, exc)
+        yield None
+        return
+
+    try:
+        yield doc
+    finally:
+        doc.close()
+
+
+def iter_images_from_pdf(doc: Optional[Any], pdf_path: str) -> Iterator[PdfImage]:
+    """
+    Yield the embedded raster images of an open PDF (see open_pdf), in page
+    order; nothing when doc is None or a byte scan finds no image XObject
+    (the pages are then never walked). Each distinct image (by xref) is yielded once, straight from
+    memory — nothing is written to disk. Icons and bullets below
+    _MIN_IMAGE_PX on either side are skipped. Long PDFs are split into
+    small page chunks across worker processes, which open pdf_path
+    themselves.
+    """
+    if doc is None or not _has_image_xobjects(pdf_path):
+        return
+    workers = min(os.cpu_count() or 1, _MAX_EXTRACT_WORKERS)
+    seen: Set[int] = set()
+    try:
+        page_count = doc.page_count
+        if page_count >= _PARALLEL_MIN_PAGES and workers > 1:
+            # Ranges are deduplicated independently; drop repeats across ranges
+            for xref, image in _iter_parallel(pdf_path, page_count, workers):
+                if xref not in seen:
+                    seen.add(xref)
+                    yield image
+        else:
+            for _, image in _iter_range(doc, 0, page_count, seen):
+                yield image
     except Exception as exc:
         logger.warning("Image extraction failed: %s", exc)
-    return images
+
+
+def _has_image_xobjects(pdf_path: str) -> bool:
+    """Cheap byte scan: False means the PDF embeds no raster images at all."""
+    try:
+        return _IMAGE_XOBJECT_RE.search(load_pdf_bytes(pdf_path)) is not None
+    except OSError:
+        return True  # let the real extraction report the problem
+
+
+def render_pages_for_vision(
+    doc: Any,
+    dpi: int = 100,
+    max_pages: int = 20,
+    jpeg_quality: int = 75,
+) -> Iterator[PdfImage]:
+    """
+    Render pages to JPEG for the vision model — the fallback for vector
+    diagrams, which have no embedded raster. Only pages whose text mentions
+    a graph term are rendered, at most max_pages of them, and only one
+    pixmap is alive at a time.
+    """
+    import fitz
+
+    matrix = fitz.Matrix(dpi / 72, dpi / 72)
+    for page_index, page in islice(_candidate_pages(doc), max_pages):
+        pix = page.get_pixmap(matrix=matrix, alpha=False)
+        yield PdfImage(page_index, "jpeg", pix.tobytes("jpeg", jpg_quality=jpeg_quality))
+
+
+def _candidate_pages(doc: Any) -> Iterator[Tuple[int, Any]]:
+    """(index, page) for each page whose text mentions a graph term."""
+    for page_index in range(doc.page_count):
+        page = doc.load_page(page_index)
+        text = page.get_text("text").lower()
+        if any(hint in text for hint in _DIAGRAM_HINTS):
+            yield page_index, page
+
+
+def _count_vision_inputs(doc: Optional[Any], pdf_path: str, max_pages: int = 20) -> int:
+    """
+    How many inputs _iter_vision_inputs would yield, without extracting,
+    decoding or rendering anything: image sizes come from the page's
+    image list, and rendered pages are only counted.
+    """
+    if doc is None:
+        return 0
+    if _has_image_xobjects(pdf_path):
+        seen: Set[int] = set()
+        count = 0
+        for page_index in range(doc.page_count):
+            for xref, _, width, height, *_ in doc.get_page_images(page_index):
+                if xref not in seen:
+                    seen.add(xref)
+                    count += min(width, height) >= _MIN_IMAGE_PX
+        if count:
+            return count
+    return sum(1 for _ in islice(_candidate_pages(doc), max_pages))
+
+
+def _iter_vision_inputs(doc: Optional[Any], pdf_path: str) -> Iterator[PdfImage]:
+    """Embedded images; if the PDF has none, rendered candidate pages instead."""
+    found = False
+    with closing(iter_images_from_pdf(doc, pdf_path)) as embedded:
+        for image in embedded:
+            found = True
+            yield image
+    if not found and doc is not None:
+        logger.info("No embedded images — rendering candidate pages for vector diagrams")
+        try:
+            yield from render_pages_for_vision(doc)
+        except Exception as exc:
+            logger.warning("Page rendering failed: %s", exc)
+
+
+def _iter_range(doc, start: int, stop: int, seen: Set[int]) -> Iterator[Tuple[int, PdfImage]]:
+    """(xref, image) for each image on pages [start, stop) whose xref is not in seen."""
+    for page_index in range(start, stop):
+        for img in doc.get_page_images(page_index):
+            xref = img[0]
+            if xref in seen:
+                continue
+            seen.add(xref)
+            info = doc.extract_image(xref)
+            if not info or min(info["width"], info["height"]) < _MIN_IMAGE_PX:
+                continue
+            yield xref, PdfImage(page_index, info["ext"], info["image"])
+
+
+def _extract_range_worker(pdf_path: str, start: int, stop: int) -> List[Tuple[int, PdfImage]]:
+    """Process-pool entry point: PyMuPDF documents cannot be shared, so each worker opens its own."""
+    import fitz
+    with fitz.open(pdf_path) as doc:
+        return list(_iter_range(doc, start, stop, set()))
+
+
+def _iter_parallel(pdf_path: str, page_count: int, workers: int) -> Iterator[Tuple[int, PdfImage]]:
+    """
+    (xref, image) pairs in page order. Pages go out in _PARALLEL_CHUNK_PAGES
+    chunks with at most 2 × workers chunks in flight, so only that many
+    chunks' image bytes are alive at once. Closing the generator early
+    cancels queued chunks without waiting for running ones.
+    """
+    starts = iter(range(0, page_count, _PARALLEL_CHUNK_PAGES))
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    pending: Deque["Future[List[Tuple[int, PdfImage]]]"] = deque()
+
+    def submit(start: int) -> None:
+        stop = min(start + _PARALLEL_CHUNK_PAGES, page_count)
+        pending.append(pool.submit(_extract_range_worker, pdf_path, start, stop))
+
+    try:
+        for start in islice(starts, 2 * workers):
+            submit(start)
+        while pending:
+            found = pending.popleft().result()
+            start = next(starts, None)
+            if start is not None:
+                submit(start)
+            yield from found
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 def analyze_diagrams(pdf_path: str) -> VisionEvidence:
+    """Synchronous entry point for analyze_diagrams_async (see src._aio.run_sync)."""
+    return run_sync(analyze_diagrams_async(pdf_path))
+
+
+async def analyze_diagrams_async(pdf_path: str) -> VisionEvidence:
     """
     Analyze architectural diagrams in the PDF report.
     Uses multimodal LLM to classify diagram type and verify parallel flow visualization.
     Execution is OPTIONAL per spec — gracefully degrades if no images found.
+    The final verdict is cached by the PDF's content hash, so re-auditing an
+    unchanged report skips both the parse and the vision calls.
     """
-    images = extract_images_from_pdf(pdf_path)
+    load_once()
+    key = await asyncio.to_thread(_pdf_cache_key, pdf_path) if judge_cache.enabled() else None
+    cached = judge_cache.get(key) if key else None
+    if cached is not None:
+        logger.info("Vision verdict for %s served from cache", pdf_path)
+        return VisionEvidence.model_validate_json(cached)
 
-    if not images:
-        logger.info("No diagrams found in PDF — graceful degradation")
-        return VisionEvidence(
-            diagram_type="none",
-            has_parallel_flow=False,
-            flow_description="No diagrams extracted from PDF",
-            confidence=0.50,
-        )
+    vision_ev, complete = await _analyze_pdf(pdf_path)
+    if key and complete:
+        judge_cache.put(key, vision_ev.model_dump_json())
+    return vision_ev
+
+
+def _pdf_cache_key(pdf_path: str) -> Optional[str]:
+    """Digest of the PDF bytes plus everything that shapes the verdict; None without PyMuPDF."""
+    if importlib.util.find_spec("fitz") is None:
+        return None  # nothing to parse, and a later install must not hit a stale 'none'
+    try:
+        digest = hashlib.sha256(load_pdf_bytes(pdf_path)).hexdigest()
+    except OSError:
+        return None
+    return judge_cache.make_key(
+        "vision-pdf",
+        os.getenv("LLM_PROVIDER", "groq"),
+        os.getenv("VISION_MODEL", ""),
+        _VISION_PROMPT,
+        str(_MIN_IMAGE_PX),
+        digest,
+    )
 
-    # In production: send images to GPT-4V or Claude Vision
-    # For now, return placeholder evidence
-    logger.info("Found %d diagrams to analyse", len(images))
 
-    # TODO: Implement multimodal LLM call here
-    # Example:
-    # response = vision_llm.invoke([
-    #     HumanMessage(content=[
-    #         {"type": "image_url", "image_url": {"url": image_path}},
-    #         {"type": "text", "text": "Is this a LangGraph StateGraph diagram with parallel branches?"}
-    #     ])
-    # ])
+async def _analyze_pdf(pdf_path: str) -> Tuple[VisionEvidence, bool]:
+    """
+    Extract and classify. PyMuPDF work runs on a worker thread one batch at
+    a time; up to VISION_CONCURRENCY batch requests are in flight at once,
+    and a new batch is only extracted when a slot frees up, so at most that
+    many batches of image bytes are alive. The flag is False when the
+    verdict is partial (no vision model, or a batch failed) and must not
+    be cached.
+    """
+    vision_llm = _vision_llm()
+    batch_size = _vision_batch_size()
+    with open_pdf(pdf_path) as doc:
+        if vision_llm is None:
+            # Nothing will look at the images: count them, don't extract them
+            n_images = await asyncio.to_thread(_count_vision_inputs, doc, pdf_path)
+            if not n_images:
+                return _no_diagrams(), True
+            return VisionEvidence(
+                diagram_type="unanalysed",
+                has_parallel_flow=False,
+                flow_description=(
+                    f"{n_images} diagrams found; no multimodal model configured "
+                    "(set VISION_MODEL)"
+                ),
+                confidence=0.30,
+            ), False
+
+        images = _iter_vision_inputs(doc, pdf_path)
+        try:
+            batch = await asyncio.to_thread(_next_batch, images, batch_size)
+            if not batch:
+                return _no_diagrams(), True
+
+            # One request per batch of images instead of one per image; batches
+            # overlap on the wire, bounded by the limiter.
+            limiter = asyncio.Semaphore(_vision_concurrency())
+            tasks: List["asyncio.Task[Tuple[Optional[VisionEvidence], bool]]"] = []
+            n_images = 0
+            while batch:
+                n_images += len(batch)
+                await limiter.acquire()
+                tasks.append(asyncio.create_task(
+                    _classify_batch(vision_llm, limiter, batch, len(tasks) + 1)
+                ))
+                batch = await asyncio.to_thread(_next_batch, images, batch_size)
+            results = await asyncio.gather(*tasks)
+        finally:
+            # Closing may tear down the extraction pool; keep it off the event loop
+            await asyncio.to_thread(images.close)
 
+    verdicts = [verdict for verdict, _ in results if verdict is not None]
+    hits = sum(hit for _, hit in results)
+    logger.info("Analysed %d diagrams in %d batches (%d from cache)", n_images, len(results), hits)
+    return _merge_verdicts(verdicts, n_images), len(verdicts) == len(results)
+
+
+def _no_diagrams() -> VisionEvidence:
+    logger.info("No diagrams found in PDF — graceful degradation")
     return VisionEvidence(
-        diagram_type="unanalysed",
+        diagram_type="none",
         has_parallel_flow=False,
-        flow_description="Vision analysis not yet implemented — requires multimodal LLM",
-        confidence=0.30,
+        flow_description="No diagrams extracted from PDF",
+        confidence=0.50,
+    )
+
+
+def _next_batch(images: Iterator[PdfImage], size: int) -> List[PreparedImage]:
+    """Pull, downsample and encode the next batch (runs on a worker thread)."""
+    return [_prepare(_downsample(image)) for image in islice(images, size)]
+
+
+def _prepare(image: PdfImage) -> PreparedImage:
+    """Hash and base64-encode once; the cache key and the request both reuse the result."""
+    mime = _MIME_TYPES.get(image.ext.lower(), "image/png")
+    encoded = base64.b64encode(image.data).decode("ascii")
+    digest = hashlib.sha256(image.data).hexdigest()
+    return PreparedImage(image.page, f"data:{mime};base64,{encoded}", digest)
+
+
+def _downsample(image: PdfImage) -> PdfImage:
+    """
+    Shrink to _VISION_MAX_EDGE px on the long edge and re-encode compactly:
+    grayscale JPEG for near-monochrome line art, else a 256-colour PNG.
+    Fewer pixels means fewer vision tokens per diagram. Returns the
+    original when Pillow is missing, decoding fails or nothing is saved.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return image
+    try:
+        with Image.open(io.BytesIO(image.data)) as img:
+            img.thumbnail((_VISION_MAX_EDGE, _VISION_MAX_EDGE), Image.Resampling.LANCZOS)
+            buf = io.BytesIO()
+            if img.getcolors(maxcolors=4) is not None:
+                img.convert("L").save(buf, "JPEG", quality=60)
+                ext = "jpeg"
+            else:
+                img.convert("RGB").convert("P", palette=Image.Palette.ADAPTIVE, colors=256) \
+                    .save(buf, "PNG", optimize=True)
+                ext = "png"
+    except Exception as exc:
+        logger.debug("Could not downsample image on page %d: %s", image.page + 1, exc)
+        return image
+    data = buf.getvalue()
+    return PdfImage(image.page, ext, data) if len(data) < len(image.data) else image
+
+
+async def _classify_batch(
+    vision_llm: Any,
+    limiter: asyncio.Semaphore,
+    batch: List[PreparedImage],
+    index: int,
+) -> Tuple[Optional[VisionEvidence], bool]:
+    """
+    Verdict for one batch (None on failure) and whether it came from the
+    cache. Batch verdicts are cached on disk by image content, model and
+    prompt. Releases the limiter slot acquired by the caller.
+    """
+    try:
+        key = _vision_cache_key(batch) if judge_cache.enabled() else None
+        cached = judge_cache.get(key) if key else None
+        if cached is not None:
+            try:
+                return VisionEvidence.model_validate_json(cached), True
+            except ValidationError as exc:
+                logger.warning("Vision batch %d: stale cache entry ignored: %s", index, exc)
+        try:
+            verdict = await vision_llm.ainvoke([_vision_message(batch)])
+        except Exception as exc:
+            logger.warning("Vision batch %d failed: %s", index, exc)
+            return None, False
+        if not isinstance(verdict, VisionEvidence):
+            logger.warning("Vision batch %d: unexpected type %s", index, type(verdict))
+            return None, False
+        if key:
+            judge_cache.put(key, verdict.model_dump_json())
+        return verdict, False
+    finally:
+        limiter.release()
+
+
+# ─────────────────────────────────────────────────────────────
+# MULTIMODAL LLM
+# ─────────────────────────────────────────────────────────────
+
+_VISION_PROMPT = (
+    "You are a forensic reviewer of software architecture diagrams taken from an "
+    "audit report. Classify the diagrams as a whole: diagram_type is 'langgraph' for "
+    "a LangGraph StateGraph, 'flowchart' for a generic flowchart, or 'other'. Set "
+    "has_parallel_flow only if a diagram shows branches that fan out from one node "
+    "and fan back in (e.g. detectives or judges running concurrently). Describe the "
+    "flow you see in flow_description and give your confidence from 0.0 to 1.0."
+)
+
+# Long-edge pixel cap for images sent to the vision model
+_VISION_MAX_EDGE = 768
+
+_MIME_TYPES = {"jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png", "gif": "image/gif", "webp": "image/webp"}
+
+
+def _vision_batch_size() -> int:
+    """Images per multimodal request (one round-trip per batch, not per image)."""
+    return env_int("VISION_BATCH_SIZE", 10)
+
+
+def _vision_concurrency() -> int:
+    """Batch requests in flight at once (provider rate limits)."""
+    return env_int("VISION_CONCURRENCY", 4)
+
+
+def _vision_llm():
+    """
+    Structured-output vision model, or None when no multimodal model is available.
+    VISION_MODEL overrides the provider default; Groq and Ollama need it set,
+    since their default chat models are text-only.
+    """
+    from src.config.langchain_config import get_llm
+
+    provider = os.getenv("LLM_PROVIDER", "groq")
+    model = os.getenv("VISION_MODEL")
+    if provider not in ("openai", "anthropic") and not model:
+        logger.info("  ℹ️  No VISION_MODEL for provider %s — skipping diagram analysis", provider)
+        return None
+    try:
+        llm = get_llm(provider=provider, model_name=model, temperature=0.0)
+        return llm.with_structured_output(VisionEvidence)
+    except Exception as exc:
+        logger.warning("Vision LLM unavailable: %s", exc)
+        return None
+
+
+def _vision_cache_key(batch: List[PreparedImage]) -> str:
+    """Digest of provider, model, prompt and every image's bytes in the batch."""
+    return judge_cache.make_key(
+        "vision",
+        os.getenv("LLM_PROVIDER", "groq"),
+        os.getenv("VISION_MODEL", ""),
+        _VISION_PROMPT,
+        *(image.sha256 for image in batch),
     )
 
 
+def _vision_message(batch: List[PreparedImage]):
+    """One HumanMessage carrying the prompt and every image in the batch as a data URL."""
+    from langchain_core.messages import HumanMessage
+
+    content: List[Dict] = [{"type": "text", "text": _VISION_PROMPT}]
+    content.extend({"type": "image_url", "image_url": {"url": image.url}} for image in batch)
+    return HumanMessage(content=content)
+
+
+def _merge_verdicts(verdicts: List[VisionEvidence], n_images: int) -> VisionEvidence:
+    """Best batch verdict: a parallel-flow finding wins, then the most confident."""
+    if not verdicts:
+        return VisionEvidence(
+            diagram_type="unanalysed",
+            has_parallel_flow=False,
+            flow_description=f"{n_images} diagrams extracted; every vision request failed",
+            confidence=0.30,
+        )
+    return max(verdicts, key=lambda v: (v.has_parallel_flow, v.confidence))
+
+
+@functools.lru_cache(maxsize=16)
+def _rationale(diagram_type: str, has_parallel_flow: bool) -> str:
+    return f"Diagram type: {diagram_type}. Parallel flow: {has_parallel_flow}"
+
+
+@functools.lru_cache(maxsize=16)
+def _tags(diagram_type: str) -> Tuple[str, ...]:
+    return ("diagram", "architecture", diagram_type)
+
+
 def vision_evidence_to_evidence(vision_ev: VisionEvidence) -> Evidence:
     """Convert VisionEvidence to standard Evidence object for state."""
-    return Evidence(
+    # VisionEvidence is already validated → model_construct skips re-validation
+    return Evidence.model_construct(
         goal="Verify architectural diagram shows parallel LangGraph topology",
         found=vision_ev.has_parallel_flow,
         content=vision_ev.flow_description,
         location="pdf_report (embedded images)",
-        rationale=f"Diagram type: {vision_ev.diagram_type}. Parallel flow: {vision_ev.has_parallel_flow}",
+        rationale=_rationale(vision_ev.diagram_type, vision_ev.has_parallel_flow),
         confidence=vision_ev.confidence,
-        tags=["diagram", "architecture", vision_ev.diagram_type],
+        tags=list(_tags(vision_ev.diagram_type)),
     )
\ No newline at end of file
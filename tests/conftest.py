@@ -0,0 +1,10 @@
+"""tests/conftest.py - shared fixtures."""
+import pytest
+
+from tests.helpers import make_minimal_state
+
+
+@pytest.fixture
+def minimal_state() -> dict:
+    """Minimal state with ONE criterion."""
+    return make_minimal_state()
@@ -0,0 +1,38 @@
+"""tests/helpers.py - state builders shared by tests and ad-hoc scripts."""
+
+
+def make_minimal_state(n_criteria: int = 1) -> dict:
+    """AgentState with n_criteria rubric dimensions, each backed by one piece of evidence."""
+    ids = ["state_management_rigor"] + [f"criterion_{i}" for i in range(2, n_criteria + 1)]
+    return {
+        "repo_url": "https://github.com/test/repo",
+        "pdf_path": "",
+        "audit_type": "self",
+        "rubric_dimensions": [{
+            "id": cid,
+            "name": "State Management Rigor",
+            "target_artifact": "github_repo",
+            "forensic_instruction": "Check for Pydantic state",
+            "success_pattern": "Pydantic found",
+            "failure_pattern": "No Pydantic",
+            "judicial_logic": {"prosecutor": "Score 1 if missing"}
+        } for cid in ids],
+        "synthesis_rules": {},
+        "evidences": {
+            cid: [{
+                "goal": "Check Pydantic",
+                "found": True,
+                "content": "class AgentState(TypedDict)",
+                "location": "src/state.py",
+                "rationale": "TypedDict found",
+                "confidence": 0.9,
+                "tags": ["pydantic"]
+            }] for cid in ids
+        },
+        "opinions": [],
+        "errors": [],
+        "final_report": None,
+        "repo_evidence": None,
+        "doc_evidence": None,
+        "vision_evidence": None,
+    }
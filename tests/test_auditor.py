@@ -0,0 +1,55 @@
+"""tests/test_auditor.py - top-level audit entry points."""
+import asyncio
+
+from src._aio import run_sync
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_sync_without_loop():
+    assert run_sync(_answer()) == 42
+
+
+async def test_run_sync_inside_running_loop():
+    """run_audit/analyze_diagrams must not die with 'asyncio.run() cannot be called ...'."""
+    assert run_sync(_answer()) == 42
+
+
+def _report():
+    from src.state import AuditReport
+    return AuditReport(
+        repo_url="https://github.com/test/repo",
+        executive_summary="ok",
+        overall_score=3.0,
+        criteria=[],
+        remediation_plan="none",
+    )
+
+
+async def test_report_saver_writes_before_returning(tmp_path, monkeypatch):
+    from src import graph
+
+    monkeypatch.setitem(graph.AUDIT_DIRS, "self", tmp_path / "self")
+    monkeypatch.setattr(graph, "LANGSMITH_LOG_DIR", tmp_path / "logs")
+    state = {"final_report": _report(), "repo_url": "https://github.com/test/repo", "audit_type": "self"}
+
+    assert await graph.report_saver_node(state) == {}
+    [written] = (tmp_path / "self").iterdir()
+    assert written.name.startswith("audit_repo_")
+
+
+async def test_report_saver_surfaces_write_errors(tmp_path, monkeypatch):
+    from src import graph
+
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setitem(graph.AUDIT_DIRS, "self", blocker)
+    monkeypatch.setattr(graph, "LANGSMITH_LOG_DIR", tmp_path / "logs")
+    state = {"final_report": _report(), "repo_url": "https://github.com/test/repo", "audit_type": "self"}
+
+    result = await graph.report_saver_node(state)
+    assert len(result["errors"]) == 1
+    assert result["errors"][0].startswith("ReportSaver:")
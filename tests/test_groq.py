@@ -1,13 +1,26 @@
 ﻿"""tests/test_groq.py - Groq integration tests."""
 import pytest
 import os
-from pathlib import Path
-import sys
 
-# Ensure src is in path
-src_path = Path(__file__).parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+
+# One client per module: get_llm memoises per config, and the fixtures make
+# every test in the class share that single instance explicitly.
+@pytest.fixture(scope="module")
+def groq_llm():
+    from src.config.langchain_config import get_llm
+    return get_llm(provider="groq", model_name="llama-3.1-8b-instant")
+
+
+@pytest.fixture(scope="module")
+def detective_llm():
+    from src.config.langchain_config import get_detective_llm
+    return get_detective_llm(task="code")
+
+
+@pytest.fixture(scope="module")
+def judge_llm():
+    from src.config.langchain_config import get_judge_llm
+    return get_judge_llm(persona="primary")
 
 
 class TestGroqConnection:
@@ -18,13 +31,10 @@ class TestGroqConnection:
         assert os.getenv("GROQ_API_KEY"), "GROQ_API_KEY not set in environment"
         assert os.getenv("GROQ_API_KEY").startswith("gsk_"), "Invalid GROQ_API_KEY format"
     
-    def test_groq_llm_initialization(self):
+    def test_groq_llm_initialization(self, groq_llm):
         """Test Groq LLM can be initialized."""
-        from src.config.langchain_config import get_llm
-        
-        llm = get_llm(provider="groq", model_name="llama-3.1-8b-instant")
-        assert llm is not None
-        assert hasattr(llm, "invoke")
+        assert groq_llm is not None
+        assert hasattr(groq_llm, "invoke")
     
     @pytest.mark.slow
     def test_groq_basic_inference(self):
@@ -39,14 +49,12 @@ class TestGroqConnection:
         assert "graph" in str(response.content).lower() or "agent" in str(response.content).lower()
     
     @pytest.mark.slow
-    def test_groq_structured_output(self):
+    def test_groq_structured_output(self, groq_llm):
         """Test Groq works with Pydantic structured output."""
         from pydantic import BaseModel
         from src.state import JudicialOpinion
-        from src.config.langchain_config import get_llm
         
-        llm = get_llm(provider="groq", model_name="llama-3.1-8b-instant")
-        structured_llm = llm.with_structured_output(JudicialOpinion)
+        structured_llm = groq_llm.with_structured_output(JudicialOpinion)
         
         # This should not raise an error
         assert structured_llm is not None
@@ -61,21 +69,15 @@ class TestGroqConnection:
             # Groq structured output support may vary by model
             pytest.skip(f"Structured output test: {e}")
     
-    def test_detective_llm_factory(self):
+    def test_detective_llm_factory(self, detective_llm):
         """Test detective LLM factory with Groq."""
-        from src.config.langchain_config import get_detective_llm
-        
-        llm = get_detective_llm(task="code")
-        assert llm is not None
-        assert hasattr(llm, "invoke")
+        assert detective_llm is not None
+        assert hasattr(detective_llm, "invoke")
     
-    def test_judge_llm_factory(self):
+    def test_judge_llm_factory(self, judge_llm):
         """Test judge LLM factory with Groq."""
-        from src.config.langchain_config import get_judge_llm
-        
-        llm = get_judge_llm(persona="primary")
-        assert llm is not None
-        assert hasattr(llm, "invoke")
+        assert judge_llm is not None
+        assert hasattr(judge_llm, "invoke")
     
     def test_provider_detection(self):
         """Test provider detection prioritizes Groq."""
@@ -0,0 +1,40 @@
+"""tests/test_judge_cache.py - on-disk verdict cache."""
+import pytest
+
+from src import judge_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("JUDGE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(judge_cache, "_CONN", None)
+    yield tmp_path
+    if judge_cache._CONN is not None:
+        judge_cache._CONN.close()
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("JUDGE_CACHE", raising=False)
+    assert not judge_cache.enabled()
+    monkeypatch.setenv("JUDGE_CACHE", "1")
+    assert judge_cache.enabled()
+
+
+def test_round_trip_in_cache_dir(cache_dir):
+    key = judge_cache.make_key("provider", "model", "prompt")
+    assert judge_cache.get(key) is None
+    judge_cache.put(key, '{"score": 4}')
+    assert judge_cache.get(key) == '{"score": 4}'
+    assert (cache_dir / "judge_cache.sqlite3").exists()
+
+
+def test_key_version_changes_keys(monkeypatch):
+    before = judge_cache.make_key("a", "b")
+    monkeypatch.setattr(judge_cache, "KEY_VERSION", "test")
+    assert judge_cache.make_key("a", "b") != before
+
+
+def test_invalid_ttl_falls_back(cache_dir, monkeypatch):
+    monkeypatch.setenv("JUDGE_CACHE_TTL", "a day")
+    judge_cache.put("k", "v")
+    assert judge_cache.get("k") == "v"
@@ -0,0 +1,156 @@
+"""tests/test_judges.py - judicial layer."""
+import pytest
+
+from src.state import JudicialBench, JudicialOpinion
+from tests.helpers import make_minimal_state
+
+
+class FakeStructuredLLM:
+    """Stands in for llm.with_structured_output(schema); counts ainvoke calls."""
+
+    def __init__(self, schema: type, criterion_ids):
+        self.schema = schema
+        self.criterion_ids = list(criterion_ids)
+        self.calls = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls += 1
+        opinions = [
+            JudicialOpinion(
+                judge="Prosecutor", criterion_id=cid, score=2,
+                argument="TypedDict only", cited_evidence=["src/state.py"],
+            )
+            for cid in self.criterion_ids
+        ]
+        if self.schema is JudicialBench:
+            return JudicialBench(opinions=opinions)
+        return opinions[0]
+
+
+@pytest.fixture
+def fake_llms(monkeypatch):
+    """Route the judges' structured clients to fakes, keyed by output schema."""
+    pytest.importorskip("langchain_core")
+    from src.nodes import judges
+
+    fakes = {}
+
+    def install(state):
+        ids = [c["id"] for c in state["rubric_dimensions"]]
+        fakes[JudicialOpinion] = FakeStructuredLLM(JudicialOpinion, ids)
+        fakes[JudicialBench] = FakeStructuredLLM(JudicialBench, ids)
+        return fakes
+
+    monkeypatch.setenv("JUDGE_CACHE", "0")
+    monkeypatch.setattr(judges, "_provider", lambda: "ollama")
+    monkeypatch.setattr(
+        judges, "_get_structured_llm",
+        lambda temperature=0.4, schema=JudicialOpinion: fakes[schema],
+    )
+    return install
+
+
+async def test_prosecutor_batch(monkeypatch, fake_llms):
+    """JUDGE_BATCH=1: one bench request covers every criterion."""
+    from src.nodes.judges import prosecutor_node
+
+    monkeypatch.setenv("JUDGE_BATCH", "1")
+    state = make_minimal_state(3)
+    fakes = fake_llms(state)
+    result = await prosecutor_node(state)
+
+    assert fakes[JudicialBench].calls == 1
+    assert fakes[JudicialOpinion].calls == 0
+    opinions = result["opinions"]
+    assert [op.criterion_id for op in opinions] == [c["id"] for c in state["rubric_dimensions"]]
+    assert [op.score for op in opinions] == [2, 2, 2]
+    assert all(op.judge == "Prosecutor" and not op.charges for op in opinions)
+
+
+async def test_prosecutor_single(monkeypatch, fake_llms, minimal_state):
+    """One criterion in, one parsed opinion out, one LLM call."""
+    from src.nodes.judges import prosecutor_node
+
+    monkeypatch.delenv("JUDGE_BATCH", raising=False)
+    fakes = fake_llms(minimal_state)
+    result = await prosecutor_node(minimal_state)
+
+    assert fakes[JudicialOpinion].calls == 1
+    [opinion] = result["opinions"]
+    assert opinion.criterion_id == "state_management_rigor"
+    assert opinion.score == 2
+    assert opinion.charges == []
+
+
+def test_vllm_provider_uses_shared_factory(monkeypatch):
+    """LLM_PROVIDER=vllm resolves through langchain_config.get_llm, not a private judge factory."""
+    pytest.importorskip("langchain_openai")
+    from src.config import langchain_config
+    from src.nodes import judges
+
+    monkeypatch.setenv("LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("VLLM_URL", "http://vllm.test:8000/v1")
+    monkeypatch.setattr(langchain_config, "_ENV", None)
+    langchain_config._LLM_CACHE.clear()
+
+    llm = judges._get_llm(temperature=0.4)
+    assert llm is langchain_config.get_llm(provider="vllm", temperature=0.4, timeout=300)
+    assert llm.openai_api_base == "http://vllm.test:8000/v1"
+
+    langchain_config._LLM_CACHE.clear()
+
+
+async def test_malformed_concurrency_falls_back(monkeypatch, fake_llms, minimal_state):
+    """A typo in JUDGE_CONCURRENCY warns and uses the default instead of failing the node."""
+    from src.nodes.judges import prosecutor_node
+
+    monkeypatch.setenv("JUDGE_CONCURRENCY", "eight")
+    fake_llms(minimal_state)
+    result = await prosecutor_node(minimal_state)
+    assert [op.score for op in result["opinions"]] == [2]
+
+
+def test_criterion_brief_cached_by_content(minimal_state):
+    pytest.importorskip("langchain_core")
+    from src.nodes import judges
+
+    criterion = minimal_state["rubric_dimensions"][0]
+    brief = judges.criterion_brief(criterion)
+    assert judges.criterion_brief(dict(criterion)) is brief
+    edited = {**criterion, "judicial_logic": {"defense": "Reward intent"}}
+    assert "DEFENSE: Reward intent" in judges.criterion_brief(edited)
+
+
+def test_provider_follows_env_reload(monkeypatch):
+    """judges reads the provider from langchain_config's snapshot, so _reload_env applies."""
+    pytest.importorskip("langchain_core")
+    from src.config import langchain_config
+    from src.nodes import judges
+
+    monkeypatch.setenv("LLM_PROVIDER", "ollama")
+    langchain_config._reload_env()
+    assert judges._provider() == "ollama"
+    monkeypatch.setenv("LLM_PROVIDER", "vllm")
+    langchain_config._reload_env()
+    assert judges._provider() == "vllm"
+    monkeypatch.undo()
+    langchain_config._reload_env()
+
+
+async def test_stale_cache_row_is_a_miss(monkeypatch, tmp_path, fake_llms, minimal_state):
+    """A cached verdict that no longer validates goes to the LLM instead of failing the node."""
+    from src import judge_cache
+    from src.nodes import judges
+
+    monkeypatch.setenv("JUDGE_CACHE", "1")
+    monkeypatch.setenv("JUDGE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(judge_cache, "_CONN", None)
+    monkeypatch.setattr(judges, "_get_llm", lambda temperature=0.4: object())
+    monkeypatch.setattr(judge_cache, "get", lambda key: '{"judge": "Prosecutor", "score": 9}')
+    fakes = fake_llms(minimal_state)
+
+    result = await judges.prosecutor_node(minimal_state)
+    assert fakes[JudicialOpinion].calls == 1
+    assert [op.score for op in result["opinions"]] == [2]
+    if judge_cache._CONN is not None:
+        judge_cache._CONN.close()
@@ -0,0 +1,106 @@
+"""tests/test_judges_batch.py - offline bench against a fake OpenAI client."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.nodes import judges_batch
+from src.state import JudicialOpinion
+
+
+class FakeClient:
+    """Just enough of the OpenAI Files/Batches surface for submit and collect."""
+
+    def __init__(self, status: str = "completed", files: dict = None):
+        self.uploads = []
+        self.created = []
+        self.status = status
+        self._files = files or {}
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+    def _upload(self, file, purpose):
+        self.uploads.append((file[1].getvalue().decode("utf-8"), purpose))
+        return SimpleNamespace(id="file-in")
+
+    def _create(self, **kwargs):
+        self.created.append(kwargs)
+        return SimpleNamespace(id="batch-1")
+
+    def _retrieve(self, batch_id):
+        return SimpleNamespace(
+            status=self.status,
+            output_file_id="file-out" if "file-out" in self._files else None,
+            error_file_id="file-err" if "file-err" in self._files else None,
+        )
+
+    def _content(self, file_id):
+        return SimpleNamespace(text=self._files[file_id])
+
+
+def _result_line(custom_id: str, content: str) -> str:
+    body = {"choices": [{"message": {"content": content}}]}
+    return json.dumps({"custom_id": custom_id, "response": {"body": body}})
+
+
+def test_build_batch_requests(minimal_state):
+    requests = judges_batch.build_batch_requests(minimal_state)
+    assert [r["custom_id"] for r in requests] == [
+        "Prosecutor:state_management_rigor",
+        "Defense:state_management_rigor",
+        "TechLead:state_management_rigor",
+    ]
+    messages = requests[0]["body"]["messages"]
+    assert "state_management_rigor" in messages[-1]["content"]
+
+
+def test_submit_uploads_jsonl(minimal_state, monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(judges_batch, "_client", lambda: client)
+
+    assert judges_batch.submit_bench_batch(minimal_state) == "batch-1"
+    payload, purpose = client.uploads[0]
+    assert purpose == "batch"
+    assert len(payload.splitlines()) == 3
+    assert client.created[0]["input_file_id"] == "file-in"
+    assert client.created[0]["endpoint"] == "/v1/chat/completions"
+
+
+def test_submit_without_dimensions(minimal_state):
+    minimal_state["rubric_dimensions"] = []
+    with pytest.raises(ValueError):
+        judges_batch.submit_bench_batch(minimal_state)
+
+
+def test_collect_while_running(monkeypatch):
+    monkeypatch.setattr(judges_batch, "_client", lambda: FakeClient(status="in_progress"))
+    assert judges_batch.collect_bench_batch("batch-1") is None
+
+
+def test_collect_failed_batch(monkeypatch):
+    monkeypatch.setattr(judges_batch, "_client", lambda: FakeClient(status="expired"))
+    with pytest.raises(RuntimeError, match="expired"):
+        judges_batch.collect_bench_batch("batch-1")
+
+
+def test_collect_parses_and_falls_back(monkeypatch):
+    good = JudicialOpinion(
+        judge="Prosecutor", criterion_id="state_management_rigor", score=2,
+        argument="TypedDict only", cited_evidence=["src/state.py"],
+    )
+    error = {"custom_id": "TechLead:state_management_rigor", "response": None,
+             "error": {"code": "server_error"}}
+    files = {
+        "file-out": "\n".join([
+            _result_line("Prosecutor:state_management_rigor", good.model_dump_json()),
+            _result_line("Defense:state_management_rigor", "not json"),
+        ]),
+        "file-err": json.dumps(error),
+    }
+    monkeypatch.setattr(judges_batch, "_client", lambda: FakeClient(files=files))
+
+    opinions = judges_batch.collect_bench_batch("batch-1")
+    assert [o.judge for o in opinions] == ["Prosecutor", "Defense", "TechLead"]
+    assert opinions[0] == good
+    assert all("PARSE_FAILURE" in o.charges for o in opinions[1:])
+    assert all(o.criterion_id == "state_management_rigor" for o in opinions)
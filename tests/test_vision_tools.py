@@ -0,0 +1,170 @@
+"""tests/test_vision_tools.py - diagram extraction on generated PDFs."""
+import asyncio
+import io
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+Image = pytest.importorskip("PIL.Image")
+
+from src import judge_cache  # noqa: E402
+from src.state import VisionEvidence  # noqa: E402
+from src.tools import vision_tools  # noqa: E402
+from src.tools.vision_tools import (  # noqa: E402
+    PdfImage,
+    _classify_batch,
+    _downsample,
+    _has_image_xobjects,
+    _iter_parallel,
+    _prepare,
+    _vision_cache_key,
+    iter_images_from_pdf,
+    open_pdf,
+)
+
+
+def _png(width: int, height: int, colour: str = "white") -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), colour).save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def diagram_pdf(tmp_path) -> str:
+    """Two pages: a diagram-sized image on the first, an icon on the second."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_image(fitz.Rect(50, 50, 350, 230), stream=_png(300, 180, "navy"))
+    page = doc.new_page()
+    page.insert_image(fitz.Rect(50, 50, 66, 66), stream=_png(16, 16, "red"))
+    path = tmp_path / "diagram.pdf"
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def text_pdf(tmp_path) -> str:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "StateGraph with parallel nodes")
+    path = tmp_path / "text.pdf"
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+def test_has_image_xobjects(diagram_pdf, text_pdf):
+    assert _has_image_xobjects(diagram_pdf)
+    assert not _has_image_xobjects(text_pdf)
+
+
+def test_iter_images_from_pdf_skips_icons(diagram_pdf):
+    with open_pdf(diagram_pdf) as doc:
+        images = list(iter_images_from_pdf(doc, diagram_pdf))
+    assert [image.page for image in images] == [0]
+    with Image.open(io.BytesIO(images[0].data)) as img:
+        assert img.size == (300, 180)
+
+
+def test_iter_images_from_pdf_without_images(text_pdf):
+    with open_pdf(text_pdf) as doc:
+        assert list(iter_images_from_pdf(doc, text_pdf)) == []
+
+
+def test_iter_parallel_streams_in_page_order(tmp_path, monkeypatch):
+    """Chunks come back in page order, and closing early does not wait on the pool."""
+    monkeypatch.setattr(vision_tools, "_PARALLEL_CHUNK_PAGES", 2)
+    logo, figure = _png(100, 100, "navy"), _png(200, 120, "green")
+    doc = fitz.open()
+    for i in range(8):
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(10, 10, 110, 110), stream=logo)
+        if i == 5:
+            page.insert_image(fitz.Rect(10, 200, 210, 320), stream=figure)
+    path = tmp_path / "long.pdf"
+    doc.save(path)
+    doc.close()
+
+    pairs = list(_iter_parallel(str(path), 8, workers=2))
+    pages = [image.page for _, image in pairs]
+    assert pages == sorted(pages)
+    assert len({xref for xref, _ in pairs}) == 2
+
+    stream = _iter_parallel(str(path), 8, workers=2)
+    next(stream)
+    stream.close()
+
+
+def test_downsample_line_art():
+    """Near-monochrome images shrink to the edge cap as grayscale JPEG."""
+    image = _downsample(PdfImage(0, "png", _png(2000, 1000)))
+    assert image.ext == "jpeg"
+    with Image.open(io.BytesIO(image.data)) as img:
+        assert img.mode == "L"
+        assert max(img.size) <= 768
+
+
+class FakeVisionLLM:
+    def __init__(self, verdict):
+        self.verdict = verdict
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return self.verdict
+
+
+@pytest.fixture
+def vision_cache(tmp_path, monkeypatch):
+    pytest.importorskip("langchain_core")
+    monkeypatch.setenv("JUDGE_CACHE", "1")
+    monkeypatch.setenv("JUDGE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(judge_cache, "_CONN", None)
+    yield
+    if judge_cache._CONN is not None:
+        judge_cache._CONN.close()
+
+
+def test_classify_batch_rejects_missing_tool_call(vision_cache):
+    """A model that skips the tool call fails only its batch and caches nothing."""
+    batch = [_prepare(PdfImage(0, "png", _png(100, 100, "navy")))]
+    result = asyncio.run(_classify_batch(FakeVisionLLM(None), asyncio.Semaphore(0), batch, 1))
+    assert result == (None, False)
+    assert judge_cache.get(_vision_cache_key(batch)) is None
+
+
+def test_classify_batch_ignores_stale_cache_entry(vision_cache):
+    batch = [_prepare(PdfImage(0, "png", _png(100, 100, "green")))]
+    judge_cache.put(_vision_cache_key(batch), '{"confidence": 7}')
+    verdict = VisionEvidence(diagram_type="langgraph", confidence=0.8)
+    llm = FakeVisionLLM(verdict)
+
+    result = asyncio.run(_classify_batch(llm, asyncio.Semaphore(0), batch, 1))
+    assert result == (verdict, False)
+    assert llm.calls == 1
+    assert judge_cache.get(_vision_cache_key(batch)) == verdict.model_dump_json()
+
+
+def test_no_vision_model_counts_without_extracting(diagram_pdf, text_pdf, monkeypatch):
+    """Without a vision model nothing is extracted, downsampled or rendered."""
+    def boom(*args, **kwargs):
+        raise AssertionError("extraction should be skipped")
+
+    monkeypatch.setattr(vision_tools, "_vision_llm", lambda: None)
+    monkeypatch.setattr(vision_tools, "_iter_vision_inputs", boom)
+    monkeypatch.setattr(vision_tools, "_next_batch", boom)
+
+    verdict, complete = asyncio.run(vision_tools._analyze_pdf(diagram_pdf))
+    assert verdict.diagram_type == "unanalysed"
+    assert verdict.flow_description.startswith("1 diagrams found")
+    assert not complete
+
+    verdict, _ = asyncio.run(vision_tools._analyze_pdf(text_pdf))
+    assert verdict.flow_description.startswith("1 diagrams found")
+
+
+def test_malformed_vision_knobs_fall_back(monkeypatch):
+    monkeypatch.setenv("VISION_BATCH_SIZE", "ten")
+    monkeypatch.setenv("VISION_CONCURRENCY", "0")
+    assert vision_tools._vision_batch_size() == 10
+    assert vision_tools._vision_concurrency() == 1